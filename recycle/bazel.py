@@ -6,168 +6,278 @@ including BUILD file generation, command invocation, and result parsing.
 """
 
 import os
+import signal
 import subprocess
 import json
-from typing import Dict, List, Any, Optional, Tuple
+import hashlib
+import threading
+from collections import deque
+from typing import IO, Deque, Dict, Iterator, List, Any, Optional, Tuple, cast
 from pathlib import Path
 import logging
+from functools import lru_cache
+
+# Bazel's build.proto bindings, generated from src/main/protobuf/build.proto
+try:
+    import build_pb2
+
+    BUILD_PROTO_AVAILABLE = True
+except ImportError:
+    BUILD_PROTO_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Lines of stdout/stderr kept from each Bazel invocation
+OUTPUT_TAIL_LINES = 10_000
 
-def check_bazel_available() -> bool:
-    """Check if Bazel is available in the system PATH."""
-    try:
-        result = subprocess.run(
-            ["bazel", "--version"], capture_output=True, text=True, timeout=10
-        )
-        return result.returncode == 0
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        return False
+# Bazel queries still running after this long are killed
+QUERY_TIMEOUT_SECS = 60
 
+# Bump when the BUILD templates change so existing files are regenerated
+_BUILD_TEMPLATE_VERSION = 1
+_BUILD_HASH_PREFIX = "# recycle-hash: "
 
-def get_bazel_version() -> Optional[str]:
-    """Get the Bazel version if available."""
+
+@lru_cache(maxsize=1)
+def _probe_bazel() -> Tuple[bool, Optional[str]]:
+    """Run `bazel --version` once and return (available, version)."""
     try:
         result = subprocess.run(
             ["bazel", "--version"], capture_output=True, text=True, timeout=10
         )
         if result.returncode == 0:
-            return result.stdout.strip()
+            return True, result.stdout.strip()
     except (subprocess.TimeoutExpired, FileNotFoundError):
         pass
-    return None
+    return False, None
+
+
+def reset_bazel_probe():
+    """Forget the cached Bazel probe so the next check runs it again."""
+    _probe_bazel.cache_clear()
+
+
+def check_bazel_available() -> bool:
+    """Check if Bazel is available in the system PATH."""
+    return _probe_bazel()[0]
+
+
+def get_bazel_version() -> Optional[str]:
+    """Get the Bazel version if available."""
+    return _probe_bazel()[1]
+
+
+class BazelClient:
+    """Builds Bazel command lines for one workspace.
+
+    Every command goes out with the same startup options, so the client
+    reconnects to the workspace's running server instead of restarting it.
+    Only the defaults are used, which plain `bazel` invocations share too.
+    """
+
+    def __init__(self, workspace_path: str, output_base: Optional[str] = None):
+        self.workspace_path = workspace_path
+        self._base = output_base
+
+    def startup_options(self) -> List[str]:
+        """Startup options passed before every Bazel command."""
+        return [f"--output_base={self._base}"] if self._base else []
+
+    def command(self, args: List[str]) -> List[str]:
+        """Build a full Bazel command line for the given command and arguments."""
+        return ["bazel"] + self.startup_options() + args
+
+
+# Bazel clients keyed by absolute workspace path
+_CLIENTS: Dict[str, BazelClient] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def get_bazel_client(workspace_path: str) -> BazelClient:
+    """Return the shared Bazel client for a workspace."""
+    key = os.path.abspath(workspace_path)
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(key)
+        if client is None:
+            client = _CLIENTS[key] = BazelClient(workspace_path)
+    return client
+
+
+def build_file_hash(repo_info: Dict[str, Any], profile_settings: Dict[str, Any]) -> str:
+    """Hash the inputs a generated BUILD file depends on."""
+    canonical = json.dumps(
+        [_BUILD_TEMPLATE_VERSION, repo_info, profile_settings],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
 
 
 def generate_bazel_build_file(
     repo_info: Dict[str, Any], repo_path: str, profile_settings: Dict[str, Any]
 ) -> str:
-    """Generate a Bazel BUILD file for a repository based on its language and profile settings."""
+    """Generate a Bazel BUILD file for a repository based on its language and profile settings.
+
+    The first line records a hash of the inputs so unchanged files can be
+    left alone (see write_bazel_build_file).
+    """
     language = repo_info.get("language", "unknown")
     repo_name = repo_info["name"]
 
-    build_content = []
-    build_content.append(f"# Generated BUILD file for {repo_name}")
-    build_content.append(f"# Language: {language}")
-    build_content.append("")
-
     if language == "python":
-        build_content.extend(
-            _generate_python_build(repo_name, repo_path, profile_settings)
-        )
+        body = _generate_python_build(repo_name, repo_path, profile_settings)
     elif language == "cpp":
-        build_content.extend(
-            _generate_cpp_build(repo_name, repo_path, profile_settings)
-        )
+        body = _generate_cpp_build(repo_name, repo_path, profile_settings)
     elif language == "rust":
-        build_content.extend(
-            _generate_rust_build(repo_name, repo_path, profile_settings)
-        )
+        body = _generate_rust_build(repo_name, repo_path, profile_settings)
     elif language == "go":
-        build_content.extend(_generate_go_build(repo_name, repo_path, profile_settings))
+        body = _generate_go_build(repo_name, repo_path, profile_settings)
     else:
-        build_content.extend(
-            _generate_generic_build(repo_name, repo_path, profile_settings)
-        )
+        body = _generate_generic_build(repo_name, repo_path, profile_settings)
+
+    return (
+        f"{_BUILD_HASH_PREFIX}{build_file_hash(repo_info, profile_settings)}\n"
+        f"# Generated BUILD file for {repo_name}\n# Language: {language}\n\n" + body
+    )
 
-    return "\n".join(build_content)
+
+def write_bazel_build_file(
+    repo_info: Dict[str, Any],
+    repo_path: str,
+    profile_settings: Dict[str, Any],
+    filename: str = "BUILD",
+) -> bool:
+    """Write a repo's BUILD file unless an up-to-date one is already there.
+
+    Leaving unchanged files untouched keeps their mtime, so Bazel doesn't
+    re-analyze the package. Returns True if the file was written.
+    """
+    build_path = os.path.join(repo_path, filename)
+    header = f"{_BUILD_HASH_PREFIX}{build_file_hash(repo_info, profile_settings)}\n"
+    try:
+        with open(build_path, "r", encoding="utf-8") as f:
+            if f.read(len(header)) == header:
+                return False
+    except OSError:
+        pass
+
+    with open(build_path, "w", encoding="utf-8") as f:
+        f.write(generate_bazel_build_file(repo_info, repo_path, profile_settings))
+    return True
+
+
+def _write_one(
+    repo_info: Dict[str, Any], repos_dir: str, profile_settings: Dict[str, Any]
+) -> Tuple[str, bool]:
+    """Refresh one repo's BUILD file."""
+    repo_path = os.path.join(repos_dir, repo_info["name"])
+    if not os.path.isdir(repo_path):
+        # Not synced yet; nothing to write into
+        return repo_info["name"], False
+    return repo_info["name"], write_bazel_build_file(
+        repo_info, repo_path, profile_settings
+    )
+
+
+def write_all_build_files(
+    repos: List[Dict[str, Any]],
+    repos_dir: str,
+    profile_settings: Dict[str, Any],
+) -> Dict[str, bool]:
+    """Write BUILD files for many repos, skipping up-to-date ones.
+
+    Returns, per repo name, whether its BUILD file was (re)written. Repos
+    without a checkout under `repos_dir` are skipped.
+    """
+    return dict(
+        _write_one(repo_info, repos_dir, profile_settings) for repo_info in repos
+    )
 
 
 def _generate_python_build(
     repo_name: str, repo_path: str, profile_settings: Dict[str, Any]
-) -> List[str]:
+) -> str:
     """Generate Python-specific Bazel BUILD rules."""
-    lines = []
-    lines.append('load("@rules_python//python:defs.bzl", "py_library", "py_binary")')
-    lines.append("")
-    lines.append(f"py_library(")
-    lines.append(f'    name = "{repo_name}",')
-    lines.append(f'    srcs = glob(["**/*.py"]),')
-    lines.append(f'    visibility = ["//visibility:public"],')
-    lines.append(f")")
-    lines.append("")
-    lines.append(f"py_binary(")
-    lines.append(f'    name = "{repo_name}_bin",')
-    lines.append(f'    srcs = ["__main__.py"],')
-    lines.append(f'    deps = [":{repo_name}"],')
-    lines.append(f")")
-    return lines
+    return f"""load("@rules_python//python:defs.bzl", "py_library", "py_binary")
+
+py_library(
+    name = "{repo_name}",
+    srcs = glob(["**/*.py"]),
+    visibility = ["//visibility:public"],
+)
+
+py_binary(
+    name = "{repo_name}_bin",
+    srcs = ["__main__.py"],
+    deps = [":{repo_name}"],
+)"""
 
 
 def _generate_cpp_build(
     repo_name: str, repo_path: str, profile_settings: Dict[str, Any]
-) -> List[str]:
+) -> str:
     """Generate C++-specific Bazel BUILD rules."""
-    lines = []
-    lines.append('load("@rules_cc//cc:defs.bzl", "cc_library", "cc_binary")')
-    lines.append("")
-
     # Apply profile settings
     cflags = profile_settings.get("cflags", "")
-    if cflags:
-        lines.append(f"cc_library(")
-        lines.append(f'    name = "{repo_name}",')
-        lines.append(f'    srcs = glob(["**/*.cpp", "**/*.cc"]),')
-        lines.append(f'    hdrs = glob(["**/*.h", "**/*.hpp"]),')
-        lines.append(f'    copts = ["{cflags}"],')
-        lines.append(f'    visibility = ["//visibility:public"],')
-        lines.append(f")")
-    else:
-        lines.append(f"cc_library(")
-        lines.append(f'    name = "{repo_name}",')
-        lines.append(f'    srcs = glob(["**/*.cpp", "**/*.cc"]),')
-        lines.append(f'    hdrs = glob(["**/*.h", "**/*.hpp"]),')
-        lines.append(f'    visibility = ["//visibility:public"],')
-        lines.append(f")")
+    copts_line = f'    copts = ["{cflags}"],\n' if cflags else ""
+
+    return f"""load("@rules_cc//cc:defs.bzl", "cc_library", "cc_binary")
 
-    return lines
+cc_library(
+    name = "{repo_name}",
+    srcs = glob(["**/*.cpp", "**/*.cc"]),
+    hdrs = glob(["**/*.h", "**/*.hpp"]),
+{copts_line}    visibility = ["//visibility:public"],
+)"""
 
 
 def _generate_rust_build(
     repo_name: str, repo_path: str, profile_settings: Dict[str, Any]
-) -> List[str]:
+) -> str:
     """Generate Rust-specific Bazel BUILD rules."""
-    lines = []
-    lines.append('load("@rules_rust//rust:defs.bzl", "rust_library", "rust_binary")')
-    lines.append("")
-    lines.append(f"rust_library(")
-    lines.append(f'    name = "{repo_name}",')
-    lines.append(f'    srcs = glob(["src/**/*.rs"]),')
-    lines.append(f'    visibility = ["//visibility:public"],')
-    lines.append(f")")
-    return lines
+    return f"""load("@rules_rust//rust:defs.bzl", "rust_library", "rust_binary")
+
+rust_library(
+    name = "{repo_name}",
+    srcs = glob(["src/**/*.rs"]),
+    visibility = ["//visibility:public"],
+)"""
 
 
 def _generate_go_build(
     repo_name: str, repo_path: str, profile_settings: Dict[str, Any]
-) -> List[str]:
+) -> str:
     """Generate Go-specific Bazel BUILD rules."""
-    lines = []
-    lines.append('load("@io_bazel_rules_go//go:def.bzl", "go_library", "go_binary")')
-    lines.append("")
-    lines.append(f"go_library(")
-    lines.append(f'    name = "{repo_name}",')
-    lines.append(f'    srcs = glob(["**/*.go"]),')
-    lines.append(f'    importpath = "github.com/example/{repo_name}",')
-    lines.append(f'    visibility = ["//visibility:public"],')
-    lines.append(f")")
-    return lines
+    return f"""load("@io_bazel_rules_go//go:def.bzl", "go_library", "go_binary")
+
+go_library(
+    name = "{repo_name}",
+    srcs = glob(["**/*.go"]),
+    importpath = "github.com/example/{repo_name}",
+    visibility = ["//visibility:public"],
+)"""
 
 
 def _generate_generic_build(
     repo_name: str, repo_path: str, profile_settings: Dict[str, Any]
-) -> List[str]:
+) -> str:
     """Generate generic BUILD rules for unknown languages."""
-    lines = []
-    lines.append(f"# Generic BUILD file for {repo_name}")
-    lines.append(f"# Language not recognized, using basic filegroup")
-    lines.append("")
-    lines.append(f"filegroup(")
-    lines.append(f'    name = "{repo_name}",')
-    lines.append(f'    srcs = glob(["**/*"]),')
-    lines.append(f'    visibility = ["//visibility:public"],')
-    lines.append(f")")
-    return lines
+    return f"""# Generic BUILD file for {repo_name}
+# Language not recognized, using basic filegroup
+
+filegroup(
+    name = "{repo_name}",
+    srcs = glob(["**/*"]),
+    visibility = ["//visibility:public"],
+)"""
+
+
+def _drain_pipe(pipe, sink: deque):
+    """Copy lines from a subprocess pipe into a bounded buffer."""
+    with pipe:
+        for line in pipe:
+            sink.append(line)
 
 
 def invoke_bazel_command(
@@ -185,22 +295,40 @@ def invoke_bazel_command(
         command.extend(["--copt", cflags])
 
     try:
-        result = subprocess.run(
+        process = subprocess.Popen(
             command,
             cwd=workspace_path,
             env=env,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            timeout=300,  # 5 minute timeout
+            bufsize=1,
         )
+    except Exception as e:
+        return False, "", f"Failed to invoke Bazel: {e}"
 
-        success = result.returncode == 0
-        return success, result.stdout, result.stderr
+    # Drain both pipes as output arrives, keeping only a bounded tail of each
+    stdout_tail: Deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+    stderr_tail: Deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+    readers = [
+        threading.Thread(target=_drain_pipe, args=(process.stdout, stdout_tail)),
+        threading.Thread(target=_drain_pipe, args=(process.stderr, stderr_tail)),
+    ]
+    for reader in readers:
+        reader.daemon = True
+        reader.start()
 
+    try:
+        returncode = process.wait(timeout=300)  # 5 minute timeout
     except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
         return False, "", "Bazel command timed out"
-    except Exception as e:
-        return False, "", f"Failed to invoke Bazel: {e}"
+    finally:
+        for reader in readers:
+            reader.join()
+
+    return returncode == 0, "".join(stdout_tail), "".join(stderr_tail)
 
 
 def build_target_with_bazel(
@@ -215,7 +343,7 @@ def build_target_with_bazel(
             "stderr": "",
         }
 
-    command = ["bazel", "build", f"//{target}"]
+    command = get_bazel_client(workspace_path).command(["build", f"//{target}"])
     success, stdout, stderr = invoke_bazel_command(
         command, workspace_path, profile_settings
     )
@@ -229,53 +357,163 @@ def build_target_with_bazel(
     }
 
 
-def query_bazel_dependencies(target: str, workspace_path: str) -> List[str]:
-    """Query Bazel for target dependencies."""
-    if not check_bazel_available():
-        return []
+def _read_varint(stream) -> Optional[int]:
+    """Read a base-128 varint from a binary stream, or None at end of stream."""
+    result = shift = 0
+    while True:
+        byte = stream.read(1)
+        if not byte:
+            if shift:
+                raise EOFError("Truncated varint in Bazel query output")
+            return None
+        result |= (byte[0] & 0x7F) << shift
+        if not byte[0] & 0x80:
+            return result
+        shift += 7
+
+
+def _target_name(target) -> Optional[str]:
+    """Return the label of a build.proto Target, whatever its kind."""
+    for kind in ("rule", "source_file", "generated_file", "package_group"):
+        if target.HasField(kind):
+            return getattr(target, kind).name
+    return None
 
+
+def _kill_query(process: subprocess.Popen):
+    """Kill a query process started by _iter_query_output, with its children."""
+    if os.name != "posix":
+        process.kill()
+        return
     try:
-        result = subprocess.run(
-            ["bazel", "query", f"deps(//{target})"],
+        os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+def _iter_query_output(
+    command: List[str], workspace_path: str, target: str, binary: bool
+) -> Iterator[Any]:
+    """Run a Bazel query and yield its stdout as it is produced.
+
+    Yields lines for text output, or the binary stream itself once for proto
+    output. Callers may stop iterating early; the process is then killed, as
+    it is if the query runs past QUERY_TIMEOUT_SECS.
+    """
+    try:
+        process = subprocess.Popen(
+            command,
             cwd=workspace_path,
-            capture_output=True,
-            text=True,
-            timeout=60,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=not binary,
+            bufsize=-1 if binary else 1,
+            # Own process group, so a kill also reaches anything it spawned
+            start_new_session=os.name == "posix",
         )
-
-        if result.returncode == 0:
-            return [line.strip() for line in result.stdout.split("\n") if line.strip()]
     except Exception as e:
         logger.error(f"Failed to query Bazel dependencies: {e}")
+        return
 
-    return []
+    stdout = cast(IO[Any], process.stdout)
+    timed_out = threading.Event()
+
+    def on_deadline():
+        # Killing the process also ends the read loop below with EOF
+        timed_out.set()
+        _kill_query(process)
+
+    deadline = threading.Timer(QUERY_TIMEOUT_SECS, on_deadline)
+    deadline.daemon = True
+    deadline.start()
+    finished = False
+    try:
+        if binary:
+            yield stdout
+        else:
+            yield from stdout
+        finished = True
+    finally:
+        stdout.close()
+        if not finished:
+            _kill_query(process)
+        returncode = process.wait()
+        deadline.cancel()
+        if timed_out.is_set():
+            logger.error(
+                f"Bazel query for //{target} timed out after {QUERY_TIMEOUT_SECS}s"
+            )
+        elif finished and returncode != 0:
+            logger.error(f"Bazel query for //{target} exited with code {returncode}")
+
+
+def iter_bazel_dependencies(target: str, workspace_path: str) -> Iterator[str]:
+    """Yield target dependencies from Bazel as the query output is produced.
+
+    Uses --output=streamed_proto when Bazel's build_pb2 bindings are
+    importable, skipping Bazel's text formatter; otherwise parses label output.
+    Callers may stop iterating early; the query process is then killed.
+    """
+    if not check_bazel_available():
+        return
+
+    client = get_bazel_client(workspace_path)
+    query = f"deps(//{target})"
+    if not BUILD_PROTO_AVAILABLE:
+        command = client.command(["query", query])
+        for line in _iter_query_output(command, workspace_path, target, False):
+            line = line.strip()
+            if line:
+                yield line
+        return
+
+    command = client.command(["query", "--output=streamed_proto", query])
+    for stream in _iter_query_output(command, workspace_path, target, True):
+        # Each Target message is prefixed with its varint-encoded length
+        while True:
+            size = _read_varint(stream)
+            if size is None:
+                break
+            name = _target_name(build_pb2.Target.FromString(stream.read(size)))
+            if name:
+                yield name
+
+
+def query_bazel_dependencies(target: str, workspace_path: str) -> List[str]:
+    """Query Bazel for target dependencies."""
+    return list(iter_bazel_dependencies(target, workspace_path))
 
 
 def generate_bazel_workspace_with_profiles(
     repos: List[Dict[str, Any]], repos_dir: str, profile_settings: Dict[str, Any]
 ) -> str:
     """Generate a Bazel WORKSPACE file with profile-specific settings."""
-    workspace_content = []
-    workspace_content.append('workspace(name = "universal_recycle")')
-    workspace_content.append("")
+    # One directory listing instead of a stat per repo
+    try:
+        with os.scandir(repos_dir) as it:
+            existing = {entry.name for entry in it if entry.is_dir()}
+    except OSError:
+        existing = set()
+
+    workspace_content = ['workspace(name = "universal_recycle")', ""]
 
     # Add profile-specific workspace settings
     if profile_settings.get("env"):
         workspace_content.append("# Profile environment variables:")
-        for key, value in profile_settings["env"].items():
-            workspace_content.append(f"# {key}={value}")
+        workspace_content.extend(
+            f"# {key}={value}" for key, value in profile_settings["env"].items()
+        )
         workspace_content.append("")
 
     # Add repository references
-    for repo in repos:
-        repo_name = repo["name"]
-        repo_path = os.path.join(repos_dir, repo_name)
-
-        if os.path.exists(repo_path):
-            workspace_content.append(f"local_repository(")
-            workspace_content.append(f'    name = "{repo_name}",')
-            workspace_content.append(f'    path = "{repo_path}",')
-            workspace_content.append(f")")
-            workspace_content.append("")
+    workspace_content.extend(
+        f"""local_repository(
+    name = "{name}",
+    path = "{os.path.join(repos_dir, name)}",
+)
+"""
+        for name in (repo["name"] for repo in repos)
+        if name in existing
+    )
 
     return "\n".join(workspace_content)
@@ -664,6 +664,9 @@ package {service_name.lower()};
 service {service_name}Service {{
     // Example RPC method
     rpc GetInfo(GetInfoRequest) returns (GetInfoResponse);
+
+    // Batched variant: one stream carries many queries in a single round trip
+    rpc GetInfoStream(stream GetInfoRequest) returns (stream GetInfoResponse);
     
     // Add more RPC methods based on the actual service
 }}
@@ -681,22 +684,56 @@ message GetInfoResponse {{
     def _generate_grpc_client(self, service_name: str) -> str:
         """Generate a Python gRPC client."""
         return f"""# Auto-generated gRPC client for {service_name}
+# Install with protobuf>=4 so messages use the fast upb backend.
+import threading
+
 import grpc
 import {service_name.lower()}_pb2
 import {service_name.lower()}_pb2_grpc
 
+# Channels shared by all clients, keyed by (host, port): [channel, refcount]
+_CHANNELS = {{}}
+_CHANNELS_LOCK = threading.Lock()
+
 class {service_name}Client:
     def __init__(self, host='localhost', port=50051):
-        self.channel = grpc.insecure_channel(f'{{host}}:{{port}}')
+        self._key = (host, port)
+        with _CHANNELS_LOCK:
+            entry = _CHANNELS.get(self._key)
+            if entry is None:
+                channel = grpc.insecure_channel(f'{{host}}:{{port}}')
+                entry = _CHANNELS[self._key] = [channel, 0]
+            entry[1] += 1
+        self.channel = entry[0]
         self.stub = {service_name.lower()}_pb2_grpc.{service_name}ServiceStub(self.channel)
+        # Per-thread request message reused across get_info calls
+        self._local = threading.local()
     
     def get_info(self, query: str) -> str:
-        request = {service_name.lower()}_pb2.GetInfoRequest(query=query)
+        request = getattr(self._local, 'request', None)
+        if request is None:
+            request = self._local.request = {service_name.lower()}_pb2.GetInfoRequest()
+        request.query = query
         response = self.stub.GetInfo(request)
         return response.info if response.success else "Error"
     
+    def get_info_many(self, queries):
+        # All queries share one streaming RPC instead of a round trip each
+        requests = ({service_name.lower()}_pb2.GetInfoRequest(query=query) for query in queries)
+        for response in self.stub.GetInfoStream(requests):
+            yield response.info if response.success else "Error"
+    
     def close(self):
-        self.channel.close()
+        # The channel is shared; only the last client using it closes it
+        if self.channel is None:
+            return
+        with _CHANNELS_LOCK:
+            entry = _CHANNELS[self._key]
+            entry[1] -= 1
+            if entry[1] == 0:
+                del _CHANNELS[self._key]
+                self.channel.close()
+        self.channel = None
 """
 
     def generate(self) -> bool:
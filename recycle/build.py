@@ -6,23 +6,79 @@ logs management, and build hooks for the Universal Recycle system.
 """
 
 import os
+import asyncio
+import heapq
+from array import array
 import json
+import mmap
 import time
-import subprocess
-from typing import Dict, List, Any, Optional
+import weakref
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, IO, List, Optional, Union
 from pathlib import Path
 import logging
-import yaml
+from copy import deepcopy
+from functools import lru_cache
+from operator import itemgetter
+
+# POSIX advisory locks; not available on Windows
+try:
+    import fcntl
+
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Buffered log entries held before they are written out to the log files
+LOG_FLUSH_EVERY = 256
+
+# Log files kept open between flushes; the least recently written is closed
+MAX_OPEN_LOGS = 64
+
+# Extra build workers beyond the CPU count, to hide I/O-bound subprocess waits
+PARALLELISM_OVERCOMMIT = 2
+
+# DOT fill colors by language
+_LANG_COLOR = {
+    "python": "lightblue",
+    "cpp": "lightgreen",
+    "rust": "orange",
+    "go": "lightcoral",
+    "javascript": "lightyellow",
+    "unknown": "lightgray",
+}
+
+
+def _dot_node_template(language: str) -> str:
+    """Build the DOT node line template for a language, leaving {n} for the name."""
+    color = _LANG_COLOR.get(language, _LANG_COLOR["unknown"])
+    escaped = language.replace("{", "{{").replace("}", "}}")
+    return '  "{n}" [fillcolor="%s", label="{n}\\n%s"];' % (color, escaped)
+
+
+# Per-language DOT node templates; other languages are built on demand
+_LANG_TPL = {language: _dot_node_template(language) for language in _LANG_COLOR}
+
 
 class BuildGraph:
     """Represents a build dependency graph."""
 
     def __init__(self):
         self.nodes = {}  # target_name -> node_info
-        self.edges = []  # list of (from, to) tuples
+        self.edges = []  # list of (from, to) tuples, without duplicates
+        self.children = {}  # target_name -> targets that depend on it
+        self._edge_set = set()
+        self._csr = None  # (names, name_to_id, indptr, indices) once frozen
 
     def add_target(
         self, name: str, language: str = "unknown", dependencies: List[str] = None
@@ -37,36 +93,56 @@ class BuildGraph:
 
         if dependencies:
             for dep in dependencies:
-                self.edges.append((dep, name))
+                edge = (dep, name)
+                # Re-adding a target must not duplicate its edges
+                if edge not in self._edge_set:
+                    self._edge_set.add(edge)
+                    self.edges.append(edge)
+                    self.children.setdefault(dep, []).append(name)
+        self._csr = None
+
+    def freeze(self):
+        """Build a compact CSR index of each target's dependencies.
+
+        Rebuilt lazily after the graph changes. Dependencies that aren't
+        targets in the graph are left out.
+        """
+        names = list(self.nodes)
+        name_to_id = {name: i for i, name in enumerate(names)}
+        indptr = array("i", [0])
+        indices = array("i")
+        for node in self.nodes.values():
+            indices.extend(
+                name_to_id[dep] for dep in node["dependencies"] if dep in name_to_id
+            )
+            indptr.append(len(indices))
+        self._csr = (names, name_to_id, indptr, indices)
+        return self._csr
 
     def get_dot_format(self) -> str:
         """Generate DOT format for graph visualization."""
-        lines = ["digraph BuildGraph {"]
-        lines.append("  rankdir=TB;")
-        lines.append("  node [shape=box, style=filled];")
-
-        # Add nodes with colors by language
-        colors = {
-            "python": "lightblue",
-            "cpp": "lightgreen",
-            "rust": "orange",
-            "go": "lightcoral",
-            "javascript": "lightyellow",
-            "unknown": "lightgray",
+        # Pull out every node's language once, then resolve templates per
+        # distinct language rather than per node
+        languages = list(map(itemgetter("language"), self.nodes.values()))
+        templates = {
+            language: _LANG_TPL.get(language) or _dot_node_template(language)
+            for language in set(languages)
         }
 
-        for name, node in self.nodes.items():
-            color = colors.get(node["language"], colors["unknown"])
-            lines.append(
-                f'  "{name}" [fillcolor="{color}", label="{name}\\n{node["language"]}"];'
-            )
-
-        # Add edges
-        for from_node, to_node in self.edges:
-            lines.append(f'  "{from_node}" -> "{to_node}";')
-
-        lines.append("}")
-        return "\n".join(lines)
+        # Add nodes with colors by language, then edges
+        nodes = "".join(
+            "\n" + templates[language].format(n=name)
+            for name, language in zip(self.nodes, languages)
+        )
+        edges = "".join(
+            f'\n  "{from_node}" -> "{to_node}";' for from_node, to_node in self.edges
+        )
+        return (
+            "digraph BuildGraph {\n  rankdir=TB;\n  node [shape=box, style=filled];"
+            + nodes
+            + edges
+            + "\n}"
+        )
 
     def save_dot_file(self, output_path: str):
         """Save the graph in DOT format to a file."""
@@ -74,6 +150,79 @@ class BuildGraph:
             f.write(self.get_dot_format())
 
 
+# Last formatted log timestamp as (whole second, string)
+_ts_cache = (0, "")
+
+
+def _now_str() -> str:
+    """Return the local time formatted for log lines, reformatted once per second."""
+    global _ts_cache
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        # Swap in a new tuple so concurrent readers never see a mixed pair
+        _ts_cache = (now, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now)))
+    return _ts_cache[1]
+
+
+def _tail(path: Union[str, Path], n: int, chunk_size: int = 8192) -> List[str]:
+    """Return the last n lines of a file, reading backwards from the end."""
+    if n <= 0:
+        return []
+
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        data = bytearray()
+        # One extra newline guarantees the first kept line is complete
+        while pos > 0 and data.count(b"\n") <= n:
+            step = min(chunk_size, pos)
+            pos -= step
+            f.seek(pos)
+            data[:0] = f.read(step)
+
+    return [line.decode() for line in data.splitlines(keepends=True)[-n:]]
+
+
+def _log_sort_key(line: str) -> str:
+    """Order log lines by their leading [timestamp]."""
+    return line.split("]")[0] if "]" in line else line
+
+
+def _flush_logs(
+    handles: "OrderedDict[str, IO[str]]", buffers: Dict[str, List[str]], logs_dir: Path
+):
+    """Write each target's pending entries to its log file and flush them."""
+    while buffers:
+        target, lines = buffers.popitem()
+        handle = handles.get(target)
+        if handle is None:
+            handle = handles[target] = open(logs_dir / f"{target}.log", "a")
+            if len(handles) > MAX_OPEN_LOGS:
+                handles.popitem(last=False)[1].close()
+        else:
+            handles.move_to_end(target)
+        # Each batch is written and flushed entirely under the lock, so
+        # concurrent writers' batches don't interleave
+        if FCNTL_AVAILABLE:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        try:
+            handle.write("".join(lines))
+            handle.flush()
+        finally:
+            if FCNTL_AVAILABLE:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def _flush_and_close_logs(
+    handles: "OrderedDict[str, IO[str]]", buffers: Dict[str, List[str]], logs_dir: Path
+):
+    """Finalizer for BuildStatus; must not reference the instance itself."""
+    _flush_logs(handles, buffers, logs_dir)
+    while handles:
+        _, handle = handles.popitem()
+        handle.close()
+
+
 class BuildStatus:
     """Tracks build status and diagnostics."""
 
@@ -83,12 +232,40 @@ class BuildStatus:
         self.status_file = self.build_dir / "status.json"
         self.logs_dir = self.build_dir / "logs"
         self.logs_dir.mkdir(exist_ok=True)
+        self._log_handles: "OrderedDict[str, IO[str]]" = OrderedDict()
+        # Entries not yet written, per target; kept out of the file objects'
+        # own buffers so nothing reaches disk outside the flush lock
+        self._log_buffers: Dict[str, List[str]] = {}
+        self._pending = 0
+        # Flush and close at interpreter exit even if close() is never called
+        self._finalizer = weakref.finalize(
+            self,
+            _flush_and_close_logs,
+            self._log_handles,
+            self._log_buffers,
+            self.logs_dir,
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
     def get_status(self) -> Dict[str, Any]:
         """Get current build status."""
         if self.status_file.exists():
-            with open(self.status_file, "r") as f:
-                return json.load(f)
+            if not ORJSON_AVAILABLE:
+                with open(self.status_file, "r") as f:
+                    return json.load(f)
+            # Parse straight from the mapped file, skipping the read/decode copy
+            with open(self.status_file, "rb") as f:
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                        return orjson.loads(memoryview(m))
+                except ValueError:
+                    # Empty files can't be mapped; let orjson report the error
+                    return orjson.loads(f.read())
         return {
             "last_build": None,
             "status": "never_built",
@@ -99,33 +276,57 @@ class BuildStatus:
 
     def update_status(self, status_data: Dict[str, Any]):
         """Update build status."""
+        if ORJSON_AVAILABLE:
+            self.status_file.write_bytes(
+                orjson.dumps(
+                    status_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                )
+            )
+            return
         with open(self.status_file, "w") as f:
             json.dump(status_data, f, indent=2)
 
     def add_log_entry(self, target: str, message: str, level: str = "info"):
         """Add a log entry for a target."""
-        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-        log_file = self.logs_dir / f"{target}.log"
+        timestamp = _now_str()
+
+        # Entries reach disk in batches from flush_logs
+        self._log_buffers.setdefault(target, []).append(
+            f"[{timestamp}] [{level.upper()}] {message}\n"
+        )
+
+        self._pending += 1
+        if self._pending >= LOG_FLUSH_EVERY:
+            self.flush_logs()
 
-        with open(log_file, "a") as f:
-            f.write(f"[{timestamp}] [{level.upper()}] {message}\n")
+    def flush_logs(self):
+        """Write buffered log entries to disk."""
+        _flush_logs(self._log_handles, self._log_buffers, self.logs_dir)
+        self._pending = 0
+
+    def close(self):
+        """Flush and close any open log files."""
+        self._finalizer()
 
     def get_recent_logs(self, target: str = None, lines: int = 50) -> List[str]:
         """Get recent build logs."""
-        logs = []
+        self.flush_logs()
 
+        log_files: List[Union[str, Path]]
         if target:
-            log_files = [self.logs_dir / f"{target}.log"]
+            log_file = self.logs_dir / f"{target}.log"
+            log_files = [log_file] if log_file.exists() else []
         else:
-            log_files = list(self.logs_dir.glob("*.log"))
-
-        for log_file in log_files:
-            if log_file.exists():
-                with open(log_file, "r") as f:
-                    file_logs = f.readlines()
-                    logs.extend(file_logs[-lines:])
+            with os.scandir(self.logs_dir) as it:
+                log_files = [
+                    entry.path
+                    for entry in it
+                    if entry.name.endswith(".log") and entry.is_file()
+                ]
 
-        return sorted(logs, key=lambda x: x.split("]")[0] if "]" in x else x)
+        # Each log is appended in time order, so merge the tails instead of sorting
+        tails = [_tail(log_file, lines) for log_file in log_files]
+        return list(heapq.merge(*tails, key=_log_sort_key))
 
 
 class BuildHooks:
@@ -142,7 +343,8 @@ class BuildHooks:
         for hook_type in ["pre", "post"]:
             hook_dir = self.hooks_dir / hook_type
             if hook_dir.exists():
-                hooks[hook_type] = [f.name for f in hook_dir.iterdir() if f.is_file()]
+                with os.scandir(hook_dir) as it:
+                    hooks[hook_type] = [entry.name for entry in it if entry.is_file()]
 
         return hooks
 
@@ -152,50 +354,78 @@ class BuildHooks:
         hook_dir.mkdir(exist_ok=True)
 
         hook_file = hook_dir / name
-        with open(hook_file, "w") as f:
-            f.write(script_content)
+        if os.name == "nt":
+            # Windows ignores mode bits
+            hook_file.write_text(script_content)
+            return
 
-        # Make executable on Unix systems
+        # Create new hooks executable in the same call that creates the file
         try:
-            os.chmod(hook_file, 0o755)
-        except:
-            pass  # Windows doesn't have chmod
+            fd = os.open(hook_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o755)
+        except FileExistsError:
+            fd = os.open(hook_file, os.O_WRONLY | os.O_TRUNC)
+            os.fchmod(fd, 0o755)
+        with os.fdopen(fd, "w") as f:
+            f.write(script_content)
+
+    async def run_hooks_async(
+        self,
+        hook_type: str,
+        context: Optional[Dict[str, Any]] = None,
+        concurrency_limit: Optional[int] = None,
+    ) -> bool:
+        """Run hooks of a specific type concurrently.
 
-    def run_hooks(self, hook_type: str, context: Dict[str, Any] = None) -> bool:
-        """Run hooks of a specific type."""
+        At most `concurrency_limit` hooks (default: CPU count) run at once.
+        """
         hook_dir = self.hooks_dir / hook_type
         if not hook_dir.exists():
             return True
 
-        success = True
-        for hook_file in hook_dir.iterdir():
-            if hook_file.is_file():
+        # Set environment variables for the hooks
+        env = os.environ.copy()
+        if context:
+            for key, value in context.items():
+                env[f"BUILD_{key.upper()}"] = str(value)
+
+        semaphore = asyncio.Semaphore(concurrency_limit or os.cpu_count() or 1)
+
+        async def run_one(hook_file: os.DirEntry) -> bool:
+            async with semaphore:
                 try:
-                    # Set environment variables for the hook
-                    env = os.environ.copy()
-                    if context:
-                        for key, value in context.items():
-                            env[f"BUILD_{key.upper()}"] = str(value)
-
-                    result = subprocess.run(
-                        [str(hook_file)],
+                    # Absolute, since the hook runs from inside hooks_dir
+                    proc = await asyncio.create_subprocess_exec(
+                        os.path.abspath(hook_file.path),
                         env=env,
-                        capture_output=True,
-                        text=True,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.PIPE,
                         cwd=self.hooks_dir,
                     )
-
-                    if result.returncode != 0:
-                        logger.error(f"Hook {hook_file.name} failed: {result.stderr}")
-                        success = False
-                    else:
-                        logger.info(f"Hook {hook_file.name} completed successfully")
-
+                    _, stderr = await proc.communicate()
+                    error_output = stderr.decode(errors="replace")
                 except Exception as e:
                     logger.error(f"Failed to run hook {hook_file.name}: {e}")
-                    success = False
+                    return False
+
+            if proc.returncode != 0:
+                logger.error(f"Hook {hook_file.name} failed: {error_output}")
+                return False
+            logger.info(f"Hook {hook_file.name} completed successfully")
+            return True
 
-        return success
+        with os.scandir(hook_dir) as it:
+            hook_files = [entry for entry in it if entry.is_file()]
+        results = await asyncio.gather(*(run_one(h) for h in hook_files))
+        return all(results)
+
+    def run_hooks(
+        self,
+        hook_type: str,
+        context: Optional[Dict[str, Any]] = None,
+        concurrency_limit: Optional[int] = None,
+    ) -> bool:
+        """Run hooks of a specific type; see run_hooks_async."""
+        return asyncio.run(self.run_hooks_async(hook_type, context, concurrency_limit))
 
 
 def generate_build_graph_from_repos(repos: List[Dict[str, Any]]) -> BuildGraph:
@@ -222,14 +452,14 @@ def generate_build_graph_from_repos(repos: List[Dict[str, Any]]) -> BuildGraph:
 
 def get_build_status() -> Dict[str, Any]:
     """Get the current build status."""
-    status = BuildStatus()
-    return status.get_status()
+    with BuildStatus() as status:
+        return status.get_status()
 
 
 def get_build_logs(target: str = None, lines: int = 50) -> List[str]:
     """Get recent build logs."""
-    status = BuildStatus()
-    return status.get_recent_logs(target, lines)
+    with BuildStatus() as status:
+        return status.get_recent_logs(target, lines)
 
 
 def list_build_hooks() -> Dict[str, List[str]]:
@@ -241,28 +471,78 @@ def list_build_hooks() -> Dict[str, List[str]]:
 def get_subgraph_for_target(graph: BuildGraph, target: str) -> BuildGraph:
     """Return a subgraph containing the target and all its dependencies."""
     subgraph = BuildGraph()
-    visited = set()
-
-    def visit(node):
-        if node in visited or node not in graph.nodes:
-            return
-        visited.add(node)
-        node_info = graph.nodes[node]
-        subgraph.add_target(node, node_info["language"], node_info["dependencies"])
-        for dep in node_info["dependencies"]:
-            visit(dep)
+    names, name_to_id, indptr, indices = graph._csr or graph.freeze()
+    if target not in name_to_id:
+        return subgraph
+
+    # Iterative depth-first walk, visiting targets in the same order as recursion
+    visited = bytearray(len(names))
+    stack = [name_to_id[target]]
+    while stack:
+        v = stack.pop()
+        if visited[v]:
+            continue
+        visited[v] = 1
+        node_info = graph.nodes[names[v]]
+        subgraph.add_target(names[v], node_info["language"], node_info["dependencies"])
+        stack.extend(reversed(indices[indptr[v] : indptr[v + 1]]))
 
-    visit(target)
     return subgraph
 
 
-def simulate_build_targets(graph: BuildGraph, targets: list) -> dict:
+def _build_in_dependency_order(
+    graph: BuildGraph,
+    targets: list,
+    build_one: Callable[[str], Any],
+    overcommit: int = PARALLELISM_OVERCOMMIT,
+) -> dict:
+    """Run build_one over targets in waves, each wave after its dependencies.
+
+    Targets whose dependencies are all built are dispatched together to a
+    thread pool (Kahn's algorithm). Returns results in the order given.
+    """
+    pending = dict.fromkeys(targets)
+    indegree = dict.fromkeys(pending, 0)
+    # Only look at edges out of the requested targets, not the whole graph
+    successors = {
+        dep: [n for n in graph.children.get(dep, ()) if n in indegree and n != dep]
+        for dep in pending
+    }
+    for names in successors.values():
+        for name in names:
+            indegree[name] += 1
+
+    results: Dict[str, Any] = {}
+    ready = deque(t for t, degree in indegree.items() if degree == 0)
+    max_workers = (os.cpu_count() or 1) + overcommit
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while len(results) < len(pending):
+            if not ready:
+                # Whatever is left is blocked by a dependency cycle; build it last
+                remaining = [t for t in pending if t not in results]
+                logger.warning(f"Targets blocked by a dependency cycle: {remaining}")
+                ready.extend(remaining)
+
+            wave = list(ready)
+            ready.clear()
+            for target, result in zip(wave, executor.map(build_one, wave)):
+                results[target] = result
+                for succ in successors.get(target, ()):
+                    indegree[succ] -= 1
+                    if indegree[succ] == 0:
+                        ready.append(succ)
+
+    return {target: results[target] for target in pending}
+
+
+def simulate_build_targets(
+    graph: BuildGraph, targets: list, overcommit: int = PARALLELISM_OVERCOMMIT
+) -> dict:
     """Simulate building the given targets in the graph. Returns build status per target."""
-    status = {}
-    for target in targets:
-        # Simulate build (in real system, invoke Bazel or build tool)
-        status[target] = "built"
-    return status
+    # Simulate build (in real system, invoke Bazel or build tool)
+    return _build_in_dependency_order(
+        graph, targets, lambda target: "built", overcommit
+    )
 
 
 # Example build_profiles.yaml structure:
@@ -277,6 +557,19 @@ def simulate_build_targets(graph: BuildGraph, targets: list) -> dict:
 #       DEBUG: "0"
 
 
+@lru_cache(maxsize=4)
+def _parse_build_profiles(profiles_path: str, mtime_ns: int) -> dict:
+    """Parse a profiles file; cached per (path, mtime) so edits are picked up."""
+    # PyYAML is only needed once a profiles file actually exists
+    import yaml
+
+    Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+    with open(profiles_path, "r") as f:
+        data = yaml.load(f, Loader=Loader)
+    return data.get("profiles", {})
+
+
 def load_build_profiles(profiles_path: str = "build_profiles.yaml") -> dict:
     """Load build profiles from a YAML config file."""
     if not os.path.exists(profiles_path):
@@ -285,9 +578,9 @@ def load_build_profiles(profiles_path: str = "build_profiles.yaml") -> dict:
             "debug": {"cflags": "-g -O0", "env": {"DEBUG": "1"}},
             "release": {"cflags": "-O3", "env": {"DEBUG": "0"}},
         }
-    with open(profiles_path, "r") as f:
-        data = yaml.safe_load(f)
-    return data.get("profiles", {})
+    profiles = _parse_build_profiles(profiles_path, os.stat(profiles_path).st_mtime_ns)
+    # Callers get their own copy so they can't alter the cached one
+    return deepcopy(profiles)
 
 
 def get_profile_settings(profile_name: str, profiles: dict) -> dict:
@@ -299,15 +592,19 @@ def get_profile_settings(profile_name: str, profiles: dict) -> dict:
 
 
 def simulate_build_targets_with_profile(
-    graph: BuildGraph, targets: list, profile_settings: dict
+    graph: BuildGraph,
+    targets: list,
+    profile_settings: dict,
+    overcommit: int = PARALLELISM_OVERCOMMIT,
 ) -> dict:
     """Simulate building targets with profile settings (flags/env)."""
-    status = {}
-    for target in targets:
+
+    def build_one(target: str) -> dict:
         # Simulate build (in real system, pass flags/env to Bazel or build tool)
-        status[target] = {
+        return {
             "result": "built",
             "cflags": profile_settings.get("cflags", ""),
             "env": profile_settings.get("env", {}),
         }
-    return status
+
+    return _build_in_dependency_order(graph, targets, build_one, overcommit)
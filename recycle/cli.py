@@ -1,4 +1,3 @@
-import yaml
 import os
 import sys
 import argparse
@@ -7,7 +6,7 @@ import subprocess
 import shutil
 import logging
 from plugin import (
-    run_adapters,
+    run_adapters_many,
     list_plugins,
     PluginManifest,
     check_plugin_health,
@@ -23,7 +22,7 @@ from distribution import (
     distribute_packages,
 )
 from typing import Dict, Any
-from wizard import run_wizard
+from wizard import run_wizard, load_config
 from templates import list_templates, copy_template, print_template_info
 from validation import (
     validate_all_configs,
@@ -82,15 +81,15 @@ try:
         check_bazel_available,
         get_bazel_version,
         build_target_with_bazel,
-        generate_bazel_build_file,
         generate_bazel_workspace_with_profiles,
+        write_all_build_files,
     )
 except ImportError:
     check_bazel_available = None
     get_bazel_version = None
     build_target_with_bazel = None
-    generate_bazel_build_file = None
     generate_bazel_workspace_with_profiles = None
+    write_all_build_files = None
 
 try:
     from collaboration import TeamManager, CICDIntegration
@@ -116,8 +115,7 @@ def load_manifest(manifest_path):
         print(f"repos.yaml not found at {manifest_path}", file=sys.stderr)
         sys.exit(1)
 
-    with open(manifest_path, "r") as f:
-        data = yaml.safe_load(f)
+    data = load_config(manifest_path)
 
     # Handle both old and new manifest formats
     if isinstance(data, list):
@@ -141,8 +139,7 @@ def load_cache_config(config_path):
             "backends": [{"type": "local", "cache_dir": ".cache/universal_recycle"}]
         }
 
-    with open(config_path, "r") as f:
-        return yaml.safe_load(f)
+    return load_config(config_path)
 
 
 def load_distribution_config_file(config_path):
@@ -154,8 +151,7 @@ def load_distribution_config_file(config_path):
         )
         return {"endpoints": {}}
 
-    with open(config_path, "r") as f:
-        return yaml.safe_load(f)
+    return load_config(config_path)
 
 
 def print_manifest(repos):
@@ -258,19 +254,15 @@ def run_adapters_on_repos(repos, repos_dir, adapter_names=None):
     """Run adapters on all repositories."""
     print("Running adapters on repositories...")
 
-    total_results = {}
-    total = len(repos)
-    for i, repo in enumerate(repos, 1):
+    jobs = []
+    for repo in repos:
         repo_name = repo["name"]
         repo_path = os.path.join(repos_dir, repo_name)
 
-        print_progress(i - 1, total, f"Adapting {repo_name}")
         if not os.path.exists(repo_path):
             print(f"  ⚠ Repository {repo_name} not found at {repo_path}")
             continue
 
-        print(f"\nProcessing {repo_name}...")
-
         # Determine which adapters to run
         adapters_to_run = adapter_names or repo.get("adapters", [])
 
@@ -278,11 +270,19 @@ def run_adapters_on_repos(repos, repos_dir, adapter_names=None):
             print(f"  No adapters specified for {repo_name}")
             continue
 
-        # Run adapters
-        results = run_adapters(repo, repo_path, adapters_to_run)
+        jobs.append((repo, repo_path, adapters_to_run))
+
+    # Repositories are adapted concurrently; results are printed in order
+    total_results = {}
+    total = len(jobs)
+    if jobs:
+        print_progress(0, total, "Adapting repositories")
+    for i, ((repo, _, _), results) in enumerate(zip(jobs, run_adapters_many(jobs)), 1):
+        repo_name = repo["name"]
         total_results[repo_name] = results
 
         # Print results
+        print(f"\nProcessing {repo_name}...")
         for adapter, success in results.items():
             status = "✓" if success else "✗"
             print(f"  {status} {adapter}")
@@ -431,6 +431,17 @@ def main():
         "--repo", help="Target specific repository for binding generation"
     )
 
+    # Init-specific arguments
+    parser.add_argument(
+        "--answers",
+        help="YAML/JSON answers file for a non-interactive init",
+    )
+    parser.add_argument(
+        "--scripted",
+        action="store_true",
+        help="Read the init wizard's answers from stdin, one per line",
+    )
+
     # Cache-specific arguments
     parser.add_argument(
         "--cache-config",
@@ -564,7 +575,7 @@ def main():
 
     if args.command == "init":
         print_header("Universal Recycle Setup Wizard")
-        success = run_wizard()
+        success = run_wizard(args.answers, scripted=args.scripted)
         if success:
             print_success("Setup completed successfully!")
             print_next_steps(
@@ -1043,8 +1054,8 @@ def main():
                 ],
             }
 
-            cache_manager = EnhancedCacheManager(cache_config)
-            stats = cache_manager.get_cache_stats()
+            with EnhancedCacheManager(cache_config) as cache_manager:
+                stats = cache_manager.get_cache_stats()
 
             print(f"\nCache Statistics:")
             print(f"  Hit Rate: {stats['hit_rate']:.2%}")
@@ -1121,6 +1132,13 @@ def main():
         print(f"  Flags: {profile_settings.get('cflags', '')}")
         print(f"  Env: {profile_settings.get('env', {})}")
 
+        if args.bazel:
+            # Refresh the synced repos' BUILD files; unchanged ones are left
+            # alone so Bazel doesn't re-analyze those packages
+            repos_dir = os.path.join(base_dir, args.repos_dir)
+            written = write_all_build_files(repos, repos_dir, profile_settings)
+            print_info(f"BUILD files updated: {sum(written.values())}/{len(written)}")
+
         # Check for distributed builds
         if args.distributed:
             if not DistributedBuildManager:
@@ -6,7 +6,7 @@ This module provides cross-platform color support for rich CLI output.
 
 import os
 import sys
-from typing import Optional
+from typing import List, Optional
 
 
 class Colors:
@@ -42,18 +42,27 @@ class Colors:
     HIDDEN = "\033[8m"
 
     # Reset
-    RESET = "\033[0m"
+    RESET = sys.intern("\033[0m")
 
-    # Semantic colors
-    SUCCESS = GREEN
-    ERROR = RED
-    WARNING = YELLOW
-    INFO = BLUE
-    HEADER = BRIGHT_MAGENTA
+    # Semantic colors, interned so lookups keyed on them share one object
+    SUCCESS = sys.intern(GREEN)
+    ERROR = sys.intern(RED)
+    WARNING = sys.intern(YELLOW)
+    INFO = sys.intern(BLUE)
+    HEADER = sys.intern(BRIGHT_MAGENTA)
 
 
-def supports_color() -> bool:
-    """Check if the terminal supports color output."""
+# Cached result of supports_color(); the terminal doesn't change mid-run
+_COLOR_ENABLED: Optional[bool] = None
+
+
+def _detect_color() -> bool:
+    """Inspect the environment and stdout to decide whether to use color."""
+    # FORCE_COLOR (https://force-color.org) turns color on even without a
+    # terminal, e.g. in CI logs that render ANSI codes
+    if os.environ.get("FORCE_COLOR"):
+        return True
+
     # Check if we're in a terminal
     if not hasattr(sys.stdout, "isatty") or not sys.stdout.isatty():
         return False
@@ -70,37 +79,85 @@ def supports_color() -> bool:
     return True
 
 
+def supports_color() -> bool:
+    """Check if the terminal supports color output (checked once per process)."""
+    global _COLOR_ENABLED
+    if _COLOR_ENABLED is None:
+        _COLOR_ENABLED = _detect_color()
+    return _COLOR_ENABLED
+
+
+# Precomputed prefixes for every Colors code, plain and bold
+_PREFIX = {
+    (color, bold): sys.intern(color + Colors.BOLD if bold else color)
+    for color in {value for name, value in vars(Colors).items() if name.isupper()}
+    for bold in (False, True)
+}
+
+
 def colorize(text: str, color: str, bold: bool = False) -> str:
     """Add color to text if supported."""
-    if not supports_color():
+    enabled = _COLOR_ENABLED
+    if enabled is None:
+        enabled = supports_color()
+    if not enabled:
         return text
 
-    result = color
-    if bold:
-        result += Colors.BOLD
-    result += text + Colors.RESET
+    prefix = _PREFIX.get((color, bold))
+    if prefix is None:
+        prefix = f"{color}\033[1m" if bold else color
+    # One f-string build; RESET is inlined to skip the attribute lookup
+    return f"{prefix}{text}\033[0m"
+
+
+def _emit(lines: List[str]):
+    """Write a block of lines to stdout in a single call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _header_lines(text: str) -> List[str]:
+    """Lines printed by print_header, for callers batching their output."""
+    return ["", colorize(text, Colors.HEADER, bold=True), "=" * len(text)]
+
 
-    return result
+def success_line(text: str) -> str:
+    """A print_success line, for callers batching their output."""
+    return colorize(f"✓ {text}", Colors.SUCCESS)
+
+
+def error_line(text: str) -> str:
+    """A print_error line, for callers batching their output."""
+    return colorize(f"✗ {text}", Colors.ERROR)
+
+
+def warning_line(text: str) -> str:
+    """A print_warning line, for callers batching their output."""
+    return colorize(f"⚠ {text}", Colors.WARNING)
+
+
+def info_line(text: str) -> str:
+    """A print_info line, for callers batching their output."""
+    return colorize(f"ℹ {text}", Colors.INFO)
 
 
 def print_success(text: str):
     """Print a success message in green."""
-    print(colorize(f"✓ {text}", Colors.SUCCESS))
+    print(success_line(text))
 
 
 def print_error(text: str):
     """Print an error message in red."""
-    print(colorize(f"✗ {text}", Colors.ERROR))
+    print(error_line(text))
 
 
 def print_warning(text: str):
     """Print a warning message in yellow."""
-    print(colorize(f"⚠ {text}", Colors.WARNING))
+    print(warning_line(text))
 
 
 def print_info(text: str):
     """Print an info message in blue."""
-    print(colorize(f"ℹ {text}", Colors.INFO))
+    print(info_line(text))
 
 
 def print_header(text: str):
@@ -118,27 +175,35 @@ def print_step(step: int, total: int, text: str):
 
 def print_summary(title: str, items: dict):
     """Print a summary with colored status indicators."""
-    print_header(title)
+    lines = _header_lines(title)
     for name, status in items.items():
         if isinstance(status, bool):
             icon = "✓" if status else "✗"
             color = Colors.SUCCESS if status else Colors.ERROR
-            print(f"  {colorize(icon, color)} {name}")
+            lines.append(f"  {colorize(icon, color)} {name}")
         else:
-            print(f"  {name}: {status}")
+            lines.append(f"  {name}: {status}")
+    _emit(lines)
+
+
+# Width of the progress bar, and a full-then-empty strip to slice bars out of
+_BAR_LENGTH = 30
+_FULL_BAR = "█" * _BAR_LENGTH + "░" * _BAR_LENGTH
 
 
 def print_progress(current: int, total: int, description: str = ""):
     """Print a progress bar."""
+    if total <= 0:
+        # Nothing to do counts as done
+        current = total = 1
+
+    percentage = current * 100 // total
     if not supports_color():
-        percentage = int((current / total) * 100)
         print(f"Progress: {percentage}% {description}")
         return
 
-    bar_length = 30
-    filled_length = int(bar_length * current // total)
-    bar = "█" * filled_length + "░" * (bar_length - filled_length)
-    percentage = int((current / total) * 100)
+    filled_length = min(max(_BAR_LENGTH * current // total, 0), _BAR_LENGTH)
+    bar = _FULL_BAR[_BAR_LENGTH - filled_length : 2 * _BAR_LENGTH - filled_length]
 
     progress_text = f"Progress: [{bar}] {percentage}% {description}"
     print(f"\r{colorize(progress_text, Colors.BRIGHT_BLUE)}", end="", flush=True)
@@ -173,77 +238,80 @@ def print_sync_summary(success_count: int, total_count: int):
 
 def print_adapter_summary(results: dict):
     """Print an adapter operation summary."""
-    print_header("Adapter Summary")
+    lines = _header_lines("Adapter Summary")
     for repo_name, repo_results in results.items():
         success_count = sum(1 for success in repo_results.values() if success)
         total_count = len(repo_results)
+        summary = f"{repo_name}: {success_count}/{total_count} adapters succeeded"
 
         if success_count == total_count:
-            print_success(
-                f"{repo_name}: {success_count}/{total_count} adapters succeeded"
-            )
+            lines.append(success_line(summary))
         else:
-            print_warning(
-                f"{repo_name}: {success_count}/{total_count} adapters succeeded"
-            )
+            lines.append(warning_line(summary))
 
             # Show which adapters failed
             for adapter, success in repo_results.items():
                 if not success:
-                    print_error(f"    {adapter} failed")
+                    lines.append(error_line(f"    {adapter} failed"))
+    _emit(lines)
 
 
 def print_binding_summary(results: dict):
     """Print a binding generation summary."""
-    print_header("Binding Generation Summary")
+    lines = _header_lines("Binding Generation Summary")
     for repo_name, repo_results in results.items():
         success_count = sum(1 for success in repo_results.values() if success)
         total_count = len(repo_results)
+        summary = f"{repo_name}: {success_count}/{total_count} generators succeeded"
 
         if success_count == total_count:
-            print_success(
-                f"{repo_name}: {success_count}/{total_count} generators succeeded"
-            )
+            lines.append(success_line(summary))
         else:
-            print_warning(
-                f"{repo_name}: {success_count}/{total_count} generators succeeded"
-            )
+            lines.append(warning_line(summary))
 
             # Show which generators failed
             for generator, success in repo_results.items():
                 if not success:
-                    print_error(f"    {generator} failed")
+                    lines.append(error_line(f"    {generator} failed"))
 
         # Show generated bindings
         if success_count > 0:
-            print_info(f"    Generated bindings available in:")
+            lines.append(info_line("    Generated bindings available in:"))
             # This would be populated based on actual generated files
-            print(f"      - {repo_name}/python_bindings/ (pybind11)")
-            print(f"      - {repo_name}/grpc/ (gRPC)")
+            lines.append(f"      - {repo_name}/python_bindings/ (pybind11)")
+            lines.append(f"      - {repo_name}/grpc/ (gRPC)")
+    _emit(lines)
 
 
 def print_cache_summary(stats: dict):
     """Print a cache operation summary."""
-    print_header("Cache Summary")
+    lines = _header_lines("Cache Summary")
     for backend_name, backend_stats in stats.items():
-        print(f"  {colorize(backend_name.upper(), Colors.BRIGHT_BLUE)} Backend:")
-        print(f"    Total files: {backend_stats.get('total_files', 0)}")
-        print(f"    Total size: {backend_stats.get('total_size_mb', 0):.2f} MB")
+        lines.append(f"  {colorize(backend_name.upper(), Colors.BRIGHT_BLUE)} Backend:")
+        lines.append(f"    Total files: {backend_stats.get('total_files', 0)}")
+        lines.append(f"    Total size: {backend_stats.get('total_size_mb', 0):.2f} MB")
         if "cache_dir" in backend_stats:
-            print(f"    Cache directory: {backend_stats['cache_dir']}")
+            lines.append(f"    Cache directory: {backend_stats['cache_dir']}")
+    _emit(lines)
 
 
 def print_validation_summary(valid: bool, errors: dict):
     """Print a validation summary."""
     if valid:
         print_success("All configuration files are valid!")
-    else:
-        print_error("Configuration validation failed!")
-        print_header("Validation Errors")
-        for file_path, file_errors in errors.items():
-            print(f"  {colorize(file_path, Colors.BRIGHT_RED)}:")
-            for error in file_errors:
-                print(f"    {colorize('✗', Colors.ERROR)} {error}")
+        return
+
+    lines = [error_line("Configuration validation failed!")]
+    lines.extend(_header_lines("Validation Errors"))
+    for file_path, file_errors in errors.items():
+        lines.append(f"  {colorize(file_path, Colors.BRIGHT_RED)}:")
+        for error in file_errors:
+            # Notes such as "... (truncated ...)" aren't errors themselves
+            if getattr(error, "is_error", True):
+                lines.append(f"    {colorize('✗', Colors.ERROR)} {error}")
+            else:
+                lines.append(f"    {colorize('ℹ', Colors.INFO)} {error}")
+    _emit(lines)
 
 
 def print_next_steps(steps: list):
@@ -288,22 +356,21 @@ def print_repository_info(repo: dict):
 
 def print_manifest_summary(repos: list):
     """Print a manifest summary."""
-    print_header("Manifest Summary")
-    print(f"  Total repositories: {len(repos)}")
+    lines = _header_lines("Manifest Summary")
+    lines.append(f"  Total repositories: {len(repos)}")
 
     # Group by language
     languages = {}
     for repo in repos:
-        lang = repo["language"]
-        if lang not in languages:
-            languages[lang] = []
-        languages[lang].append(repo["name"])
+        languages.setdefault(repo["language"], []).append(repo["name"])
 
-    print("  By language:")
+    lines.append("  By language:")
     for lang, repos_list in languages.items():
-        print(f"    {colorize(lang, Colors.BRIGHT_GREEN)}: {len(repos_list)} repos")
-        for repo_name in repos_list:
-            print(f"      - {repo_name}")
+        lines.append(
+            f"    {colorize(lang, Colors.BRIGHT_GREEN)}: {len(repos_list)} repos"
+        )
+        lines.extend(f"      - {repo_name}" for repo_name in repos_list)
+    _emit(lines)
 
 
 def print_workspace_info(workspace_path: str, repo_count: int):
@@ -321,9 +388,9 @@ def print_workspace_info(workspace_path: str, repo_count: int):
 
 def print_distribution_summary(results: dict):
     """Print a distribution operation summary."""
-    print_header("Distribution Summary")
+    lines = _header_lines("Distribution Summary")
     for repo_name, repo_results in results.items():
-        print(f"  {colorize(repo_name, Colors.BRIGHT_BLUE)}:")
+        lines.append(f"  {colorize(repo_name, Colors.BRIGHT_BLUE)}:")
 
         for package_type, endpoint_results in repo_results.items():
             if isinstance(endpoint_results, dict):
@@ -331,18 +398,19 @@ def print_distribution_summary(results: dict):
                     1 for success in endpoint_results.values() if success
                 )
                 total_count = len(endpoint_results)
+                summary = (
+                    f"    {package_type}: {success_count}/{total_count} "
+                    "endpoints succeeded"
+                )
 
                 if success_count == total_count:
-                    print_success(
-                        f"    {package_type}: {success_count}/{total_count} endpoints succeeded"
-                    )
+                    lines.append(success_line(summary))
                 else:
-                    print_warning(
-                        f"    {package_type}: {success_count}/{total_count} endpoints succeeded"
-                    )
+                    lines.append(warning_line(summary))
 
                 # Show individual endpoint results
                 for endpoint_name, success in endpoint_results.items():
                     icon = "✓" if success else "✗"
                     color = Colors.SUCCESS if success else Colors.ERROR
-                    print(f"      {colorize(icon, color)} {endpoint_name}")
+                    lines.append(f"      {colorize(icon, color)} {endpoint_name}")
+    _emit(lines)
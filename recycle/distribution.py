@@ -11,14 +11,31 @@ import yaml
 import subprocess
 import logging
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Set, Union
 from dataclasses import dataclass
 import tempfile
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
 
+def _load_json_file(path: str) -> Any:
+    """Parse a JSON manifest, using orjson on the raw bytes when available."""
+    data = Path(path).read_bytes()
+    if ORJSON_AVAILABLE:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 @dataclass
 class DistributionConfig:
     """Configuration for distribution endpoints."""
@@ -34,6 +51,10 @@ class DistributionEndpoint:
     def __init__(self, config: DistributionConfig):
         self.config = config
         self.name = self.__class__.__name__
+        # Configured endpoint name (e.g. "pypi" or "testpypi"); set by the manager
+        self.instance_name = self.name
+        # Scratch directories handed out by prepare_package, released by close()
+        self._tempdirs: List[tempfile.TemporaryDirectory] = []
 
     def log(self, message: str, level: str = "info"):
         """Log a message with the endpoint name prefix."""
@@ -56,6 +77,11 @@ class DistributionEndpoint:
         """Validate that credentials are properly configured."""
         raise NotImplementedError
 
+    def close(self):
+        """Release any temporary directories created while preparing packages."""
+        while self._tempdirs:
+            self._tempdirs.pop().cleanup()
+
 
 class PyPIDistributionEndpoint(DistributionEndpoint):
     """PyPI distribution endpoint for Python packages."""
@@ -181,8 +207,7 @@ class NpmDistributionEndpoint(DistributionEndpoint):
         # Build the package if needed
         try:
             # Check if build script exists
-            with open(package_json_path, "r") as f:
-                pkg_data = json.load(f)
+            pkg_data = _load_json_file(package_json_path)
 
             if "scripts" in pkg_data and "build" in pkg_data["scripts"]:
                 self.log("Building npm package...")
@@ -206,8 +231,7 @@ class NpmDistributionEndpoint(DistributionEndpoint):
 
         try:
             # Check if package is scoped
-            with open(os.path.join(package_path, "package.json"), "r") as f:
-                pkg_data = json.load(f)
+            pkg_data = _load_json_file(os.path.join(package_path, "package.json"))
 
             package_name = pkg_data.get("name", "")
             is_scoped = package_name.startswith("@")
@@ -247,8 +271,17 @@ class VcpkgDistributionEndpoint(DistributionEndpoint):
             self.log("Git not found", "error")
             return False
 
-    def prepare_package(self, source_path: str, package_config: Dict[str, Any]) -> str:
-        """Prepare a C++ package for vcpkg distribution."""
+    def prepare_package(
+        self,
+        source_path: str,
+        package_config: Dict[str, Any],
+        scratch: Optional[str] = None,
+    ) -> str:
+        """Prepare a C++ package for vcpkg distribution.
+
+        The port is written under ``scratch`` when given. Otherwise a temporary
+        directory is created and kept alive until :meth:`close` is called.
+        """
         self.log(f"Preparing vcpkg package from {source_path}")
 
         # Check if vcpkg.json exists
@@ -258,12 +291,16 @@ class VcpkgDistributionEndpoint(DistributionEndpoint):
             return ""
 
         # Create a temporary directory for the vcpkg port
-        temp_dir = tempfile.mkdtemp(prefix="vcpkg_port_")
+        if scratch is None:
+            tempdir = tempfile.TemporaryDirectory(prefix="vcpkg_port_")
+            self._tempdirs.append(tempdir)
+            temp_dir = tempdir.name
+        else:
+            temp_dir = scratch
 
         try:
             # Read vcpkg.json
-            with open(vcpkg_json_path, "r") as f:
-                vcpkg_data = json.load(f)
+            vcpkg_data = _load_json_file(vcpkg_json_path)
 
             package_name = vcpkg_data.get("name", "unknown")
 
@@ -284,7 +321,9 @@ class VcpkgDistributionEndpoint(DistributionEndpoint):
 
         except Exception as e:
             self.log(f"Failed to prepare vcpkg package: {e}", "error")
-            shutil.rmtree(temp_dir, ignore_errors=True)
+            if scratch is None:
+                self._tempdirs.remove(tempdir)
+                tempdir.cleanup()
             return ""
 
     def _create_portfile_cmake(
@@ -340,6 +379,10 @@ file(INSTALL ${{SOURCE_PATH}}/LICENSE DESTINATION ${{CURRENT_PACKAGES_DIR}}/shar
 class CratesIoDistributionEndpoint(DistributionEndpoint):
     """crates.io distribution endpoint for Rust packages."""
 
+    def __init__(self, config: DistributionConfig):
+        super().__init__(config)
+        self._verified_paths: Set[str] = set()
+
     def can_distribute(self, package_type: str) -> bool:
         return package_type.lower() in ["rust", "rs"]
 
@@ -375,24 +418,18 @@ class CratesIoDistributionEndpoint(DistributionEndpoint):
             self.log(f"Cargo.toml not found at {cargo_toml_path}", "error")
             return ""
 
-        # Build the package
         try:
-            subprocess.run(
-                ["cargo", "build", "--release"],
-                cwd=source_path,
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-
-            # Check if package is ready for publishing
-            subprocess.run(
-                ["cargo", "package", "--allow-dirty"],
-                cwd=source_path,
-                check=True,
-                capture_output=True,
-                text=True,
-            )
+            # cargo package builds the crate in a clean sandbox, so a separate
+            # `cargo build --release` beforehand would only duplicate work
+            if self.config.options.get("verify", True):
+                subprocess.run(
+                    ["cargo", "package", "--allow-dirty"],
+                    cwd=source_path,
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                )
+                self._verified_paths.add(source_path)
 
             self.log("Rust package prepared successfully")
             return source_path
@@ -406,9 +443,14 @@ class CratesIoDistributionEndpoint(DistributionEndpoint):
         self.log(f"Publishing to crates.io from {package_path}")
 
         try:
+            # Skip the rebuild if prepare_package already verified the crate
+            cmd = ["cargo", "publish"]
+            if package_path in self._verified_paths:
+                cmd.append("--no-verify")
+
             # Publish to crates.io
             subprocess.run(
-                ["cargo", "publish"],
+                cmd,
                 cwd=package_path,
                 check=True,
                 capture_output=True,
@@ -528,6 +570,17 @@ class DistributionManager:
         self.endpoints: Dict[str, DistributionEndpoint] = {}
         self._setup_endpoints()
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Release resources held by all endpoints."""
+        for endpoint in self.endpoints.values():
+            endpoint.close()
+
     def _setup_endpoints(self):
         """Set up distribution endpoints based on configuration."""
         endpoints_config = self.config.get("endpoints", {})
@@ -548,6 +601,7 @@ class DistributionManager:
 
                 endpoint_class = DISTRIBUTION_REGISTRY[endpoint_type]
                 endpoint = endpoint_class(config)
+                endpoint.instance_name = endpoint_name
 
                 if endpoint.validate_credentials():
                     self.endpoints[endpoint_name] = endpoint
@@ -584,18 +638,21 @@ class DistributionManager:
         """Distribute a package to all applicable endpoints."""
         results = {}
 
-        # Get applicable endpoints
+        # Get applicable endpoints, keyed by their configured name so that
+        # several endpoints of the same class don't overwrite each other
         if target_endpoints:
-            endpoints = [
-                self.endpoints[name]
+            endpoints = {
+                name: self.endpoints[name]
                 for name in target_endpoints
                 if name in self.endpoints
-            ]
+            }
         else:
-            endpoints = self.get_endpoints_for_package_type(package_type)
+            endpoints = {
+                endpoint.instance_name: endpoint
+                for endpoint in self.get_endpoints_for_package_type(package_type)
+            }
 
-        for endpoint in endpoints:
-            endpoint_name = endpoint.name
+        for endpoint_name, endpoint in endpoints.items():
             self.log(f"Distributing to {endpoint_name}...")
 
             try:
@@ -628,11 +685,25 @@ class DistributionManager:
     def get_status(self) -> Dict[str, Any]:
         """Get status of all distribution endpoints."""
         status = {"endpoints": {}, "total_endpoints": len(self.endpoints)}
+        if not self.endpoints:
+            return status
+
+        # Each validation spawns a child process; run them concurrently
+        with ThreadPoolExecutor(max_workers=len(self.endpoints)) as executor:
+            validated = dict(
+                zip(
+                    self.endpoints,
+                    executor.map(
+                        lambda endpoint: endpoint.validate_credentials(),
+                        self.endpoints.values(),
+                    ),
+                )
+            )
 
         for name, endpoint in self.endpoints.items():
             status["endpoints"][name] = {
                 "type": endpoint.config.endpoint_type,
-                "validated": endpoint.validate_credentials(),
+                "validated": validated[name],
             }
 
         return status
@@ -657,65 +728,66 @@ def distribute_packages(
     target_repos: Optional[List[str]] = None,
 ) -> Dict[str, Dict[str, bool]]:
     """Distribute packages for all repositories."""
-    manager = DistributionManager(distribution_config)
     all_results = {}
 
-    for repo in repos:
-        repo_name = repo["name"]
+    # The manager owns scratch directories used by prepared packages
+    with DistributionManager(distribution_config) as manager:
+        for repo in repos:
+            repo_name = repo["name"]
 
-        # Skip if not in target repos
-        if target_repos and repo_name not in target_repos:
-            continue
+            # Skip if not in target repos
+            if target_repos and repo_name not in target_repos:
+                continue
 
-        repo_path = os.path.join(repos_dir, repo_name)
-        if not os.path.exists(repo_path):
-            logger.warning(f"Repository {repo_name} not found at {repo_path}")
-            continue
+            repo_path = os.path.join(repos_dir, repo_name)
+            # A single directory scan answers both "does the repo exist" and
+            # "which bindings were generated"
+            try:
+                with os.scandir(repo_path) as it:
+                    binding_dirs = {
+                        entry.name: entry.path
+                        for entry in it
+                        if entry.name.endswith("_bindings") and entry.is_dir()
+                    }
+            except (FileNotFoundError, NotADirectoryError):
+                logger.warning(f"Repository {repo_name} not found at {repo_path}")
+                continue
 
-        logger.info(f"Distributing packages for {repo_name}")
+            logger.info(f"Distributing packages for {repo_name}")
 
-        # Determine package types based on generated bindings
-        package_types = []
-        if os.path.exists(os.path.join(repo_path, "python_bindings")):
-            if repo.get("language") == "rust":
-                package_types.append("rust")  # PyO3
-            else:
-                package_types.append("python")  # pybind11
-
-        if os.path.exists(os.path.join(repo_path, "wasm_bindings")):
-            package_types.append("wasm")
-
-        if not package_types:
-            logger.info(f"No distributable packages found for {repo_name}")
-            continue
-
-        # Distribute each package type
-        repo_results = {}
-        for package_type in package_types:
-            package_config = {
-                "name": repo_name,
-                "version": "0.1.0",
-                "language": repo.get("language", "unknown"),
-                "source_repo": repo.get("git", ""),
-                "commit": repo.get("commit", ""),
-            }
+            # Determine package types (and their source paths) from generated bindings
+            package_sources = {}
+            python_bindings = binding_dirs.get("python_bindings")
+            if python_bindings:
+                if repo.get("language") == "rust":
+                    package_sources["rust"] = python_bindings  # PyO3
+                else:
+                    package_sources["python"] = python_bindings  # pybind11
 
-            # Determine source path based on package type
-            if package_type == "python":
-                source_path = os.path.join(repo_path, "python_bindings")
-            elif package_type == "rust":
-                source_path = os.path.join(repo_path, "python_bindings")
-            elif package_type == "wasm":
-                source_path = os.path.join(repo_path, "wasm_bindings")
-            else:
-                source_path = repo_path
+            wasm_bindings = binding_dirs.get("wasm_bindings")
+            if wasm_bindings:
+                package_sources["wasm"] = wasm_bindings
+
+            if not package_sources:
+                logger.info(f"No distributable packages found for {repo_name}")
+                continue
+
+            # Distribute each package type
+            repo_results = {}
+            for package_type, source_path in package_sources.items():
+                package_config = {
+                    "name": repo_name,
+                    "version": "0.1.0",
+                    "language": repo.get("language", "unknown"),
+                    "source_repo": repo.get("git", ""),
+                    "commit": repo.get("commit", ""),
+                }
 
-            if os.path.exists(source_path):
                 results = manager.distribute_package(
                     source_path, package_type, package_config
                 )
                 repo_results[package_type] = results
 
-        all_results[repo_name] = repo_results
+            all_results[repo_name] = repo_results
 
     return all_results
@@ -6,18 +6,54 @@ and performance monitoring for enterprise-scale deployments.
 """
 
 import os
+import asyncio
 import json
 import time
 import hashlib
 import threading
+from array import array
+from collections import deque
+from dataclasses import dataclass, field
+from itertools import islice
 from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 import subprocess
 
 logger = logging.getLogger(__name__)
 
+# History kept by PerformanceMonitor; aggregates still cover every sample
+DEFAULT_MAX_SAMPLES = 10_000
+DEFAULT_MAX_ERRORS = 1000
+
+# Cache keys only address content, they are not a security boundary; a 128-bit
+# BLAKE2b digest is plenty and hashes faster than SHA-256 without SHA-NI
+_CACHE_KEY_DIGEST_SIZE = 16
+
+
+def _new_key_hasher(data: bytes = b""):
+    """Hasher used for (non-cryptographic) cache keys."""
+    return hashlib.blake2b(data, digest_size=_CACHE_KEY_DIGEST_SIZE)
+
+
+def _freeze(value: Any) -> Any:
+    """Turn nested dicts/lists into hashable tuples, tagged by type.
+
+    Leaves carry their type too: True, 1 and 1.0 compare and hash equal but
+    serialize differently, so they must not share an interned profile.
+    """
+    if isinstance(value, dict):
+        return (dict,) + tuple(
+            sorted((_freeze(k), _freeze(v)) for k, v in value.items())
+        )
+    if isinstance(value, (list, tuple)):
+        return (list,) + tuple(_freeze(v) for v in value)
+    if isinstance(value, float):
+        # -0.0 == 0.0 as well; repr keeps them apart like json.dumps does
+        return (float, repr(value))
+    return (type(value), value)
+
 
 class DistributedBuildManager:
     """Manages distributed builds across multiple nodes."""
@@ -25,6 +61,7 @@ class DistributedBuildManager:
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.nodes = config.get("nodes", [])
+        self._node_index = {node["id"]: node for node in self.nodes}
         self.max_workers = config.get("max_workers", 4)
         self.build_queue = []
         self.active_builds = {}
@@ -33,6 +70,11 @@ class DistributedBuildManager:
         self, node_id: str, host: str, port: int, capabilities: List[str]
     ) -> bool:
         """Add a build node to the distributed system."""
+        # Check if node already exists
+        if node_id in self._node_index:
+            logger.warning(f"Node {node_id} already exists")
+            return False
+
         node = {
             "id": node_id,
             "host": host,
@@ -43,20 +85,19 @@ class DistributedBuildManager:
             "load": 0.0,
         }
 
-        # Check if node already exists
-        for existing_node in self.nodes:
-            if existing_node["id"] == node_id:
-                logger.warning(f"Node {node_id} already exists")
-                return False
-
         self.nodes.append(node)
+        self._node_index[node_id] = node
         logger.info(f"Added build node {node_id} at {host}:{port}")
         return True
 
-    def distribute_build(
+    async def distribute_build_async(
         self, targets: List[str], profile_settings: Dict[str, Any]
     ) -> Dict[str, Any]:
-        """Distribute build targets across available nodes."""
+        """Distribute build targets across available nodes.
+
+        Node builds run concurrently on the event loop, at most `max_workers`
+        at a time.
+        """
         if not self.nodes:
             return {"error": "No build nodes available"}
 
@@ -65,32 +106,33 @@ class DistributedBuildManager:
         if not available_nodes:
             return {"error": "No available build nodes"}
 
-        # Simple round-robin distribution
-        distribution = {}
-        for i, target in enumerate(targets):
-            node = available_nodes[i % len(available_nodes)]
-            if node["id"] not in distribution:
-                distribution[node["id"]] = []
-            distribution[node["id"]].append(target)
+        # Simple round-robin distribution: node i gets every n-th target
+        # starting at i, taken with one slice per node
+        n = len(available_nodes)
+        distribution = {
+            node["id"]: targets[i::n]
+            for i, node in enumerate(available_nodes[: len(targets)])
+        }
 
-        # Execute builds in parallel
-        results = {}
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_node = {}
+        # Execute builds concurrently
+        semaphore = asyncio.Semaphore(max(1, self.max_workers))
 
-            for node_id, node_targets in distribution.items():
-                future = executor.submit(
-                    self._execute_node_build, node_id, node_targets, profile_settings
+        async def run_one(node_id: str, node_targets: List[str]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._execute_node_build(
+                    node_id, node_targets, profile_settings
                 )
-                future_to_node[future] = node_id
 
-            for future in as_completed(future_to_node):
-                node_id = future_to_node[future]
-                try:
-                    result = future.result()
-                    results[node_id] = result
-                except Exception as e:
-                    results[node_id] = {"error": str(e)}
+        items = distribution.items()
+        outcomes = await asyncio.gather(
+            *(run_one(node_id, node_targets) for node_id, node_targets in items),
+            return_exceptions=True,
+        )
+        results = {}
+        for node_id, result in zip(distribution, outcomes):
+            if isinstance(result, Exception):
+                result = {"error": str(result)}
+            results[node_id] = result
 
         return {
             "distribution": distribution,
@@ -99,11 +141,17 @@ class DistributedBuildManager:
             "nodes_used": len(distribution),
         }
 
-    def _execute_node_build(
+    def distribute_build(
+        self, targets: List[str], profile_settings: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Distribute build targets across available nodes from synchronous code."""
+        return asyncio.run(self.distribute_build_async(targets, profile_settings))
+
+    async def _execute_node_build(
         self, node_id: str, targets: List[str], profile_settings: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Execute build on a specific node."""
-        node = next((n for n in self.nodes if n["id"] == node_id), None)
+        node = self._node_index.get(node_id)
         if not node:
             return {"error": f"Node {node_id} not found"}
 
@@ -112,8 +160,8 @@ class DistributedBuildManager:
         node["status"] = "building"
         node["current_build"] = targets
 
-        # Simulate build time
-        time.sleep(2)  # Simulated build time
+        # Simulate build time without holding a thread
+        await asyncio.sleep(2)  # Simulated build time
 
         build_results = {}
         for target in targets:
@@ -159,12 +207,65 @@ class EnhancedCacheManager:
         self.local_cache_dir.mkdir(parents=True, exist_ok=True)
         self.remote_backends = config.get("remote_backends", [])
         self.cache_stats = {"hits": 0, "misses": 0, "uploads": 0, "downloads": 0}
+        self._stats_lock = threading.Lock()
+        # Running size of the local cache; rescanned only when marked dirty
+        self._local_cache_bytes = 0
+        self._cache_size_dirty = True
+        # Remote lookups run concurrently so a miss costs the slowest backend,
+        # not the sum of all of them; the pool is started on the first lookup
+        self._remote_exec: Optional[ThreadPoolExecutor] = None
+        self._remote_exec_lock = threading.Lock()
+        # Canonical JSON and a pre-seeded key hasher per distinct profile, so
+        # targets sharing a profile don't re-serialize it
+        self._profile_intern: Dict[tuple, Tuple[bytes, Any]] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Shut down the remote lookup threads, if any were started."""
+        with self._remote_exec_lock:
+            executor, self._remote_exec = self._remote_exec, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _remote_executor(self) -> ThreadPoolExecutor:
+        """Thread pool for remote lookups, created on first use."""
+        with self._remote_exec_lock:
+            if self._remote_exec is None:
+                self._remote_exec = ThreadPoolExecutor(
+                    max_workers=len(self.remote_backends),
+                    thread_name_prefix="ur-cache",
+                )
+            return self._remote_exec
+
+    def _count(self, *stats: str):
+        """Increment cache counters; lookups may run on several threads."""
+        with self._stats_lock:
+            for stat in stats:
+                self.cache_stats[stat] += 1
 
     def get_cache_key(self, target: str, profile_settings: Dict[str, Any]) -> str:
         """Generate a cache key for a target and profile combination."""
-        # Create a hash of the target and profile settings
-        content = f"{target}:{json.dumps(profile_settings, sort_keys=True)}"
-        return hashlib.sha256(content.encode()).hexdigest()
+        # Hash the profile settings then the target; targets sharing a profile
+        # start from a copy of the same pre-seeded hasher
+        try:
+            profile_key = _freeze(profile_settings)
+            interned = self._profile_intern.get(profile_key)
+        except TypeError:
+            # Unhashable leaf values; serialize without interning
+            profile_key = interned = None
+        if interned is None:
+            serialized = json.dumps(profile_settings, sort_keys=True).encode()
+            interned = (serialized, _new_key_hasher(serialized + b":"))
+            if profile_key is not None:
+                self._profile_intern[profile_key] = interned
+        hasher = interned[1].copy()
+        hasher.update(target.encode())
+        return hasher.hexdigest()
 
     def get_from_cache(self, cache_key: str) -> Optional[Dict[str, Any]]:
         """Get build artifacts from cache."""
@@ -172,33 +273,46 @@ class EnhancedCacheManager:
         local_path = self.local_cache_dir / f"{cache_key}.json"
         if local_path.exists():
             try:
-                with open(local_path, "r") as f:
+                with open(local_path, "rb") as f:
                     result = json.load(f)
-                self.cache_stats["hits"] += 1
+                self._count("hits")
                 logger.info(f"Cache hit for key {cache_key}")
                 return result
             except Exception as e:
                 logger.error(f"Failed to load from local cache: {e}")
 
-        # Try remote caches
-        for backend in self.remote_backends:
-            try:
-                result = self._get_from_remote_cache(backend, cache_key)
+        # Query all remote caches at once and take the first hit
+        futures: Dict[Future, Dict[str, Any]] = {}
+        if self.remote_backends:
+            executor = self._remote_executor()
+            for backend in self.remote_backends:
+                future = executor.submit(
+                    self._get_from_remote_cache, backend, cache_key
+                )
+                futures[future] = backend
+        try:
+            for future in as_completed(futures):
+                backend = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to get from remote cache {backend['type']}: {e}"
+                    )
+                    continue
                 if result:
                     # Store in local cache for future use
                     self._store_in_local_cache(cache_key, result)
-                    self.cache_stats["hits"] += 1
-                    self.cache_stats["downloads"] += 1
+                    self._count("hits", "downloads")
                     logger.info(
                         f"Remote cache hit for key {cache_key} from {backend['type']}"
                     )
                     return result
-            except Exception as e:
-                logger.warning(
-                    f"Failed to get from remote cache {backend['type']}: {e}"
-                )
+        finally:
+            for future in futures:
+                future.cancel()
 
-        self.cache_stats["misses"] += 1
+        self._count("misses")
         logger.info(f"Cache miss for key {cache_key}")
         return None
 
@@ -211,7 +325,7 @@ class EnhancedCacheManager:
         for backend in self.remote_backends:
             try:
                 self._store_in_remote_cache(backend, cache_key, build_result)
-                self.cache_stats["uploads"] += 1
+                self._count("uploads")
                 logger.info(f"Stored in remote cache {backend['type']}")
             except Exception as e:
                 logger.warning(
@@ -226,8 +340,21 @@ class EnhancedCacheManager:
         """Store build result in local cache."""
         try:
             cache_file = self.local_cache_dir / f"{cache_key}.json"
-            with open(cache_file, "w") as f:
-                json.dump(build_result, f, indent=2)
+            data = json.dumps(build_result, separators=(",", ":")).encode()
+            # Write then rename so concurrent readers never see a partial file;
+            # the temp name is unique per process and thread
+            tmp_file = cache_file.with_suffix(
+                f".{os.getpid()}.{threading.get_ident()}.tmp"
+            )
+            with open(tmp_file, "wb") as f:
+                f.write(data)
+            try:
+                replaced = cache_file.stat().st_size
+            except FileNotFoundError:
+                replaced = 0
+            os.replace(tmp_file, cache_file)
+            with self._stats_lock:
+                self._local_cache_bytes += len(data) - replaced
             return True
         except Exception as e:
             logger.error(f"Failed to store in local cache: {e}")
@@ -316,49 +443,145 @@ class EnhancedCacheManager:
             "remote_backends": len(self.remote_backends),
         }
 
+    def evict_from_local_cache(self, cache_key: str) -> bool:
+        """Remove an entry from the local cache."""
+        cache_file = self.local_cache_dir / f"{cache_key}.json"
+        try:
+            size = cache_file.stat().st_size
+            cache_file.unlink()
+        except FileNotFoundError:
+            return False
+        with self._stats_lock:
+            self._local_cache_bytes -= size
+        return True
+
+    def invalidate_local_cache_size(self):
+        """Force a rescan of the local cache size, e.g. after external changes."""
+        self._cache_size_dirty = True
+
     def _get_local_cache_size(self) -> int:
         """Get local cache size in bytes."""
-        total_size = 0
-        for file_path in self.local_cache_dir.rglob("*"):
-            if file_path.is_file():
-                total_size += file_path.stat().st_size
-        return total_size
+        if self._cache_size_dirty:
+            # Iterative scandir walk; DirEntry reuses the readdir file type
+            total_size = 0
+            stack = [str(self.local_cache_dir)]
+            while stack:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total_size += entry.stat(follow_symlinks=False).st_size
+            with self._stats_lock:
+                self._local_cache_bytes = total_size
+                self._cache_size_dirty = False
+        return self._local_cache_bytes
+
+
+@dataclass
+class BuildSamples:
+    """Build time samples for one target, stored column by column.
+
+    Keeps the most recent `maxlen` samples; older ones are dropped in batches
+    once the columns reach twice that length.
+    """
+
+    maxlen: int = DEFAULT_MAX_SAMPLES
+    durations: array = field(default_factory=lambda: array("d"))
+    profiles: List[str] = field(default_factory=list)
+    timestamps: array = field(default_factory=lambda: array("d"))
+
+    def append(self, duration: float, profile: str, timestamp: float):
+        """Record one sample."""
+        self.durations.append(duration)
+        self.profiles.append(profile)
+        self.timestamps.append(timestamp)
+        if len(self.durations) >= 2 * self.maxlen:
+            excess = len(self.durations) - self.maxlen
+            del self.durations[:excess]
+            del self.profiles[:excess]
+            del self.timestamps[:excess]
+
+    def __len__(self) -> int:
+        return len(self.durations)
+
+
+@dataclass
+class CacheSamples:
+    """Cache operation timings for one cache type and operation.
+
+    Bounded the same way as BuildSamples.
+    """
+
+    maxlen: int = DEFAULT_MAX_SAMPLES
+    durations: array = field(default_factory=lambda: array("d"))
+    timestamps: array = field(default_factory=lambda: array("d"))
+
+    def append(self, duration: float, timestamp: float):
+        """Record one sample."""
+        self.durations.append(duration)
+        self.timestamps.append(timestamp)
+        if len(self.durations) >= 2 * self.maxlen:
+            excess = len(self.durations) - self.maxlen
+            del self.durations[:excess]
+            del self.timestamps[:excess]
+
+    def __len__(self) -> int:
+        return len(self.durations)
 
 
 class PerformanceMonitor:
     """Monitor and track performance metrics."""
 
-    def __init__(self):
-        self.metrics = {
+    def __init__(
+        self,
+        max_samples: int = DEFAULT_MAX_SAMPLES,
+        max_errors: int = DEFAULT_MAX_ERRORS,
+    ):
+        self._sample_cap = max_samples
+        # build_times: target -> BuildSamples; cache_performance: cache type ->
+        # operation -> CacheSamples; errors: the most recent error records
+        self.metrics: Dict[str, Any] = {
             "build_times": {},
             "cache_performance": {},
             "resource_usage": {},
-            "errors": [],
+            "errors": deque(maxlen=max_errors),
         }
         self.start_time = time.time()
 
+        # Running aggregates so reports don't rescan every sample
+        self._build_total = 0.0
+        self._build_count = 0
+        self._cache_hits = 0
+        self._cache_ops = 0
+        self._error_count = 0
+
     def record_build_time(self, target: str, duration: float, profile: str):
         """Record build time for a target."""
-        if target not in self.metrics["build_times"]:
-            self.metrics["build_times"][target] = []
+        # One probe in the steady state; the buckets are only built on first use
+        build_times = self.metrics["build_times"]
+        samples = build_times.get(target)
+        if samples is None:
+            samples = build_times[target] = BuildSamples(self._sample_cap)
 
-        self.metrics["build_times"][target].append(
-            {"duration": duration, "profile": profile, "timestamp": time.time()}
-        )
+        samples.append(duration, profile, time.time())
+        self._build_total += duration
+        self._build_count += 1
 
     def record_cache_performance(
         self, cache_type: str, operation: str, duration: float
     ):
         """Record cache performance metrics."""
-        if cache_type not in self.metrics["cache_performance"]:
-            self.metrics["cache_performance"][cache_type] = {}
+        operations = self.metrics["cache_performance"].setdefault(cache_type, {})
+        samples = operations.get(operation)
+        if samples is None:
+            samples = operations[operation] = CacheSamples(self._sample_cap)
 
-        if operation not in self.metrics["cache_performance"][cache_type]:
-            self.metrics["cache_performance"][cache_type][operation] = []
-
-        self.metrics["cache_performance"][cache_type][operation].append(
-            {"duration": duration, "timestamp": time.time()}
-        )
+        samples.append(duration, time.time())
+        self._cache_ops += 1
+        # Assume operations with duration < 0.1s are hits
+        if duration < 0.1:
+            self._cache_hits += 1
 
     def record_error(
         self, error_type: str, message: str, context: Dict[str, Any] = None
@@ -372,39 +595,28 @@ class PerformanceMonitor:
                 "timestamp": time.time(),
             }
         )
+        self._error_count += 1
 
     def get_performance_report(self) -> Dict[str, Any]:
         """Generate a performance report."""
         report = {
             "uptime": time.time() - self.start_time,
-            "total_builds": sum(
-                len(times) for times in self.metrics["build_times"].values()
-            ),
+            "total_builds": self._build_count,
             "average_build_time": self._calculate_average_build_time(),
             "cache_hit_rate": self._calculate_cache_hit_rate(),
-            "error_count": len(self.metrics["errors"]),
-            "recent_errors": self.metrics["errors"][-10:],  # Last 10 errors
+            "error_count": self._error_count,
+            # Last 10 errors, oldest first
+            "recent_errors": list(islice(reversed(self.metrics["errors"]), 10))[::-1],
         }
 
         return report
 
     def _calculate_average_build_time(self) -> float:
         """Calculate average build time across all targets."""
-        all_times = []
-        for target_times in self.metrics["build_times"].values():
-            all_times.extend([t["duration"] for t in target_times])
-
-        return sum(all_times) / len(all_times) if all_times else 0.0
+        if not self._build_count:
+            return 0.0
+        return self._build_total / self._build_count
 
     def _calculate_cache_hit_rate(self) -> float:
         """Calculate cache hit rate."""
-        total_operations = 0
-        total_hits = 0
-
-        for cache_type in self.metrics["cache_performance"].values():
-            for operation_times in cache_type.values():
-                total_operations += len(operation_times)
-                # Assume "get" operations with duration < 0.1s are hits
-                total_hits += sum(1 for t in operation_times if t["duration"] < 0.1)
-
-        return total_hits / max(1, total_operations)
+        return self._cache_hits / max(1, self._cache_ops)
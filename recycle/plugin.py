@@ -6,15 +6,124 @@ process repositories (lint, modernize, scan, bind-gen, etc.).
 """
 
 import os
+import hashlib
+import json
 import subprocess
+import threading
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from collections import deque
+from uuid import uuid4
+from typing import IO, Callable, Deque, Dict, List, Any, Optional, Tuple, cast
 import logging
 import yaml
 import shutil
 
+try:
+    import fcntl
+
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 logger = logging.getLogger(__name__)
 
+# Source files handed to one clang-tidy process; keeps argv well under ARG_MAX
+CLANG_TIDY_BATCH_SIZE = 64
+
+# Per-repo record of files clang-tidy passed, relative to the repository root
+CLANG_TIDY_CACHE_FILE = os.path.join(".recycle", "clang-tidy.cache.json")
+
+# Threads used to read plugin manifests during discovery
+PLUGIN_DISCOVERY_WORKERS = 8
+
+# Trailing lines of a failed command's output included in its error log
+COMMAND_OUTPUT_TAIL_LINES = 200
+
+# Repository language names handled by the Python and C++ adapters
+_PY_LANGS = frozenset({"python", "py"})
+_CPP_LANGS = frozenset({"cpp", "c++", "cxx"})
+
+_CPP_SOURCE_SUFFIXES = (".cpp", ".cc", ".cxx", ".h", ".hpp")
+
+# Linux ioctl that shares a file's extents copy-on-write (btrfs, xfs, ...)
+_FICLONE = 0x40049409
+
+
+def _stream_command(
+    cmd: List[str], cwd: str, log: Callable[[str, str], None]
+) -> Tuple[int, Deque[str]]:
+    """Run a command, logging its output as it arrives.
+
+    Only the last COMMAND_OUTPUT_TAIL_LINES lines are kept, for error reports.
+    """
+    tail: Deque[str] = deque(maxlen=COMMAND_OUTPUT_TAIL_LINES)
+    # Hand the child an absolute path so exec doesn't search PATH again
+    program = cmd[0]
+    if os.sep not in program:
+        program = _resolve_tool(program) or program
+    with subprocess.Popen(
+        [program, *cmd[1:]],
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    ) as proc:
+        for line in cast(IO[str], proc.stdout):
+            log(line.rstrip("\n"), "debug")
+            tail.append(line)
+        return proc.wait(), tail
+
+
+@lru_cache(maxsize=None)
+def _resolve_tool(name: str) -> Optional[str]:
+    """Absolute path of an executable on PATH, looked up once per process."""
+    return shutil.which(name)
+
+
+@lru_cache(maxsize=None)
+def _ruff_executable() -> Optional[str]:
+    """ruff on PATH, else the binary shipped with an importable ruff package."""
+    path = _resolve_tool("ruff")
+    if path:
+        return path
+    try:
+        from ruff.__main__ import find_ruff_bin
+
+        return find_ruff_bin()
+    except (ImportError, FileNotFoundError):
+        return None
+
+
+def _tool_available(name: str) -> bool:
+    """Check whether an executable is on PATH."""
+    return _resolve_tool(name) is not None
+
+
+def _file_digest(path: str) -> str:
+    """Content hash used to spot unchanged files between runs."""
+    with open(path, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+
+def _iter_cpp_sources(root: str):
+    """Yield C++ source paths under root, skipping hidden directories like .git."""
+    try:
+        it = os.scandir(root)
+    except OSError:
+        return
+    with it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if not entry.name.startswith("."):
+                    yield from _iter_cpp_sources(entry.path)
+            elif entry.name.endswith(_CPP_SOURCE_SUFFIXES):
+                yield entry.path
+
 
 class PluginError(Exception):
     """Base exception for plugin-related errors."""
@@ -45,51 +154,28 @@ class AdapterPlugin(ABC):
         log_func = getattr(logger, level)
         log_func(f"[{self.name}] {message}")
 
+    def _run_command(self, cmd: List[str], cwd: Optional[str] = None) -> bool:
+        """Run a command and return success status."""
+        returncode, tail = _stream_command(cmd, cwd or self.repo_path, self.log)
+        if returncode == 0:
+            self.log(f"Command succeeded: {' '.join(cmd)}")
+            return True
+        self.log(f"Command failed: {' '.join(cmd)} - {''.join(tail)}", "error")
+        return False
+
 
 class PythonAdapter(AdapterPlugin):
     """Base class for Python-specific adapters."""
 
     def can_handle(self, language: str) -> bool:
-        return language.lower() in ["python", "py"]
-
-    def _run_command(self, cmd: List[str], cwd: Optional[str] = None) -> bool:
-        """Run a command and return success status."""
-        try:
-            result = subprocess.run(
-                cmd,
-                cwd=cwd or self.repo_path,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            self.log(f"Command succeeded: {' '.join(cmd)}")
-            return True
-        except subprocess.CalledProcessError as e:
-            self.log(f"Command failed: {' '.join(cmd)} - {e.stderr}", "error")
-            return False
+        return language.casefold() in _PY_LANGS
 
 
 class CppAdapter(AdapterPlugin):
     """Base class for C++-specific adapters."""
 
     def can_handle(self, language: str) -> bool:
-        return language.lower() in ["cpp", "c++", "cxx"]
-
-    def _run_command(self, cmd: List[str], cwd: Optional[str] = None) -> bool:
-        """Run a command and return success status."""
-        try:
-            result = subprocess.run(
-                cmd,
-                cwd=cwd or self.repo_path,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            self.log(f"Command succeeded: {' '.join(cmd)}")
-            return True
-        except subprocess.CalledProcessError as e:
-            self.log(f"Command failed: {' '.join(cmd)} - {e.stderr}", "error")
-            return False
+        return language.casefold() in _CPP_LANGS
 
 
 # Concrete adapter implementations
@@ -100,15 +186,17 @@ class RuffAdapter(PythonAdapter):
         self.log("Running ruff linter and formatter")
 
         # Check if ruff is available
-        if not self._run_command(["ruff", "--version"]):
+        ruff = _ruff_executable()
+        if not ruff:
             self.log("Ruff not found, skipping", "warning")
             return True
 
-        # Run ruff check
-        check_success = self._run_command(["ruff", "check", "."])
+        # Lint and format are separate ruff commands; both passes are needed
+        # since `check --fix` would also apply lint fixes
+        check_success = self._run_command([ruff, "check", "."])
 
         # Run ruff format
-        format_success = self._run_command(["ruff", "format", "."])
+        format_success = self._run_command([ruff, "format", "."])
 
         return check_success and format_success
 
@@ -120,7 +208,7 @@ class MyPyAdapter(PythonAdapter):
         self.log("Running mypy type checker")
 
         # Check if mypy is available
-        if not self._run_command(["mypy", "--version"]):
+        if not _tool_available("mypy"):
             self.log("MyPy not found, skipping", "warning")
             return True
 
@@ -129,35 +217,90 @@ class MyPyAdapter(PythonAdapter):
 
 
 class ClangTidyAdapter(CppAdapter):
-    """Clang-tidy linter for C++."""
+    """Clang-tidy linter for C++.
+
+    Files that passed on a previous run and haven't changed since are skipped;
+    their content hashes are kept in CLANG_TIDY_CACHE_FILE under the repo.
+    """
 
     def run(self) -> bool:
         self.log("Running clang-tidy")
 
         # Check if clang-tidy is available
-        if not self._run_command(["clang-tidy", "--version"]):
+        if not _tool_available("clang-tidy"):
             self.log("Clang-tidy not found, skipping", "warning")
             return True
 
         # Find C++ source files
-        cpp_files = []
-        for root, dirs, files in os.walk(self.repo_path):
-            for file in files:
-                if file.endswith((".cpp", ".cc", ".cxx", ".h", ".hpp")):
-                    cpp_files.append(os.path.join(root, file))
+        cpp_files = list(_iter_cpp_sources(self.repo_path))
 
         if not cpp_files:
             self.log("No C++ files found", "warning")
             return True
 
-        # Run clang-tidy on each file
+        # Cache entries are keyed by path relative to the repo root
+        config = self._config_digest()
+        passed = self._load_cache(config)
+        hashes = {path: _file_digest(path) for path in cpp_files}
+        rel = {path: os.path.relpath(path, self.repo_path) for path in cpp_files}
+        clean = {
+            rel[path]: hashes[path]
+            for path in cpp_files
+            if passed.get(rel[path]) == hashes[path]
+        }
+        changed = [path for path in cpp_files if rel[path] not in clean]
+
+        # A changed header can affect any file that includes it; recheck all
+        if any(path.endswith((".h", ".hpp")) for path in changed):
+            changed = cpp_files
+            clean = {}
+        if not changed:
+            self.log("No changes since the last clean run")
+            return True
+
+        # Run clang-tidy on batches of files, one process per batch
         success = True
-        for cpp_file in cpp_files[:5]:  # Limit to first 5 files for demo
-            if not self._run_command(["clang-tidy", cpp_file]):
+        for i in range(0, len(changed), CLANG_TIDY_BATCH_SIZE):
+            batch = changed[i : i + CLANG_TIDY_BATCH_SIZE]
+            if self._run_command(["clang-tidy", *batch]):
+                clean.update((rel[path], hashes[path]) for path in batch)
+            else:
                 success = False
 
+        self._save_cache(config, clean)
         return success
 
+    def _config_digest(self) -> Optional[str]:
+        """Hash of the repo's .clang-tidy; a change invalidates the cache."""
+        try:
+            return _file_digest(os.path.join(self.repo_path, ".clang-tidy"))
+        except OSError:
+            return None
+
+    def _load_cache(self, config: Optional[str]) -> Dict[str, str]:
+        """Hashes of files that passed last time, if the config is unchanged."""
+        cache_path = os.path.join(self.repo_path, CLANG_TIDY_CACHE_FILE)
+        try:
+            with open(cache_path, "r") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if cache.get("config") != config:
+            return {}
+        return cache.get("files", {})
+
+    def _save_cache(self, config: Optional[str], files: Dict[str, str]):
+        """Write the cache atomically; failures only cost a slower next run."""
+        cache_path = os.path.join(self.repo_path, CLANG_TIDY_CACHE_FILE)
+        tmp_path = f"{cache_path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump({"config": config, "files": files}, f)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            self.log(f"Failed to write clang-tidy cache: {e}", "warning")
+
 
 class VcpkgManifestAdapter(CppAdapter):
     """Generate vcpkg manifest for C++ projects."""
@@ -181,10 +324,9 @@ class VcpkgManifestAdapter(CppAdapter):
         }
 
         try:
-            import json
-
+            # Serialize first so the file is written in one call
             with open(manifest_path, "w") as f:
-                json.dump(manifest_content, f, indent=2)
+                f.write(json.dumps(manifest_content, indent=2))
             self.log(f"Created vcpkg.json at {manifest_path}")
             return True
         except Exception as e:
@@ -214,24 +356,71 @@ def get_plugin(
 
 
 def run_adapters(
-    repo: Dict[str, Any], repo_path: str, adapters: List[str]
+    repo: Dict[str, Any],
+    repo_path: str,
+    adapters: List[str],
+    max_workers: Optional[int] = None,
 ) -> Dict[str, bool]:
-    """Run specified adapters on a repository."""
-    results = {}
+    """Run specified adapters on a repository.
+
+    Adapters mostly wait on linter subprocesses, so up to `max_workers`
+    (default: CPU count) run concurrently; results keep the order of `adapters`.
+    """
+    results: Dict[str, bool] = {}
+    runnable = []
 
     for adapter_name in adapters:
         plugin = get_plugin(adapter_name, repo_path, {"repo": repo})
         if plugin and plugin.can_handle(repo.get("language", "")):
-            results[adapter_name] = plugin.run()
+            runnable.append((adapter_name, plugin))
+            # Placeholder that keeps the adapter's slot; set once it has run
+            results[adapter_name] = False
         else:
             logger.warning(
                 f"Adapter '{adapter_name}' cannot handle language '{repo.get('language', '')}'"
             )
             results[adapter_name] = False
 
+    if not runnable:
+        return results
+
+    workers = min(len(runnable), max_workers or os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            (adapter_name, executor.submit(plugin.run))
+            for adapter_name, plugin in runnable
+        ]
+        for adapter_name, future in futures:
+            results[adapter_name] = future.result()
+
     return results
 
 
+def run_adapters_many(
+    jobs: List[Tuple[Dict[str, Any], str, List[str]]],
+    max_workers: Optional[int] = None,
+) -> List[Dict[str, bool]]:
+    """Run adapters on several repositories concurrently.
+
+    `jobs` holds (repo, repo_path, adapters) triples; one result dict is
+    returned per job, in job order. `max_workers` (default: CPU count) bounds
+    the total number of threads, split between repositories and the adapters
+    within each one.
+    """
+    if not jobs:
+        return []
+
+    budget = max_workers or os.cpu_count() or 1
+    repo_workers = min(len(jobs), budget)
+    adapter_workers = max(1, budget // repo_workers)
+    with ThreadPoolExecutor(max_workers=repo_workers) as executor:
+        futures = [
+            executor.submit(run_adapters, repo, repo_path, adapters, adapter_workers)
+            for repo, repo_path, adapters in jobs
+        ]
+        return [future.result() for future in futures]
+
+
 class PluginManifest:
     """Represents a plugin manifest (metadata)."""
 
@@ -241,7 +430,7 @@ class PluginManifest:
 
     def _load_manifest(self, path: str) -> Dict[str, Any]:
         with open(path, "r") as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=_SafeLoader)
 
     @property
     def name(self) -> str:
@@ -271,47 +460,151 @@ class PluginManifest:
     def tags(self) -> List[str]:
         return self.data.get("tags", [])
 
+    @cached_property
+    def search_blob(self) -> str:
+        """Lowercased name, language, description and tags, one per line."""
+        return "\n".join(
+            [self.name, self.language, self.description, *self.tags]
+        ).lower()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plugin metadata as returned by list_plugins."""
+        return {
+            "name": self.name,
+            "version": self.version,
+            "description": self.description,
+            "language": self.language,
+            "author": self.author,
+            "tags": self.tags,
+            "path": self.path,
+        }
+
+
+# discover_local_plugins() results keyed by plugins_dir, with the
+# (path, directory mtime, manifest mtime) of each plugin they were read from
+_PLUGIN_CACHE: Dict[
+    str, Tuple[Tuple[Tuple[str, int, Optional[int]], ...], List[PluginManifest]]
+] = {}
+
+# Name prefix of removed plugin directories awaiting deletion
+_TRASH_PREFIX = ".trash-"
+
+# Parsed manifests keyed by path, with the manifest file's mtime
+_MANIFEST_CACHE: Dict[str, Tuple[int, PluginManifest]] = {}
+
+
+def _get_manifest(manifest_path: str, mtime: Optional[int] = None) -> PluginManifest:
+    """Load a manifest, reusing the parsed copy while the file is unchanged.
+
+    Pass `mtime` (st_mtime_ns) when the caller has already stat'ed the file.
+    """
+    if mtime is None:
+        mtime = os.stat(manifest_path).st_mtime_ns
+    cached = _MANIFEST_CACHE.get(manifest_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    manifest = PluginManifest(manifest_path)
+    _MANIFEST_CACHE[manifest_path] = (mtime, manifest)
+    return manifest
+
+
+def _clone_or_copy(src: str, dst: str) -> str:
+    """copytree copy_function: reflink the file where supported, else copy it."""
+    if FCNTL_AVAILABLE:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        except OSError:
+            pass
+        else:
+            shutil.copystat(src, dst)
+            return dst
+    return shutil.copy2(src, dst)
+
+
+def _try_get_manifest(manifest_path: str) -> Optional[PluginManifest]:
+    """Load a manifest for discovery; None if it is missing or broken."""
+    try:
+        return _get_manifest(manifest_path)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Failed to load plugin manifest: {manifest_path}: {e}")
+        return None
+
+
+def _empty_trash(plugins_dir: str):
+    """Delete removed plugins that were moved aside by remove_plugin."""
+    try:
+        with os.scandir(plugins_dir) as it:
+            trash = [e.path for e in it if e.name.startswith(_TRASH_PREFIX)]
+    except OSError:
+        return
+    for path in trash:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def _plugin_signature(plugin_dir: str) -> Tuple[str, int, Optional[int]]:
+    """Identify a plugin directory's state by its own and its manifest's mtime."""
+    try:
+        manifest_mtime: Optional[int] = os.stat(
+            os.path.join(plugin_dir, "plugin.yaml")
+        ).st_mtime_ns
+    except FileNotFoundError:
+        manifest_mtime = None
+    return plugin_dir, os.stat(plugin_dir).st_mtime_ns, manifest_mtime
+
 
 def discover_local_plugins(plugins_dir: str) -> List[PluginManifest]:
-    """Discover plugin manifests in the local plugins directory."""
-    manifests = []
-    if not os.path.exists(plugins_dir):
+    """Discover plugin manifests in the local plugins directory.
+
+    Results are memoized per process until a plugin directory or manifest is
+    added, removed or modified.
+    """
+    manifests: List[PluginManifest] = []
+    try:
+        with os.scandir(plugins_dir) as it:
+            plugin_dirs = [
+                entry.path
+                for entry in it
+                if entry.is_dir() and not entry.name.startswith(_TRASH_PREFIX)
+            ]
+        signature = tuple(_plugin_signature(path) for path in plugin_dirs)
+    except OSError:
         return manifests
-    for entry in os.listdir(plugins_dir):
-        entry_path = os.path.join(plugins_dir, entry)
-        if os.path.isdir(entry_path):
-            manifest_path = os.path.join(entry_path, "plugin.yaml")
-            if os.path.exists(manifest_path):
-                try:
-                    manifests.append(PluginManifest(manifest_path))
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to load plugin manifest: {manifest_path}: {e}"
-                    )
-    return manifests
+
+    cached = _PLUGIN_CACHE.get(plugins_dir)
+    if cached is not None and cached[0] == signature:
+        return list(cached[1])
+
+    manifest_paths = [
+        os.path.join(path, "plugin.yaml")
+        for path, _, manifest_mtime in signature
+        if manifest_mtime is not None
+    ]
+
+    # Manifest reads are IO-bound; overlap them, keeping directory order
+    if manifest_paths:
+        workers = min(PLUGIN_DISCOVERY_WORKERS, len(manifest_paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            loaded = executor.map(_try_get_manifest, manifest_paths)
+            manifests = [manifest for manifest in loaded if manifest is not None]
+    _PLUGIN_CACHE[plugins_dir] = (signature, manifests)
+    return list(manifests)
 
 
 def list_plugins(plugins_dir: str) -> List[Dict[str, Any]]:
     """List all available plugins with metadata."""
-    manifests = discover_local_plugins(plugins_dir)
-    plugins = []
-    for manifest in manifests:
-        plugins.append(
-            {
-                "name": manifest.name,
-                "version": manifest.version,
-                "description": manifest.description,
-                "language": manifest.language,
-                "author": manifest.author,
-                "tags": manifest.tags,
-                "path": manifest.path,
-            }
-        )
-    return plugins
-
-
-def check_plugin_health(plugin_dir: str) -> dict:
-    """Check the health of a plugin: manifest validity, entrypoint existence, etc."""
+    return [manifest.to_dict() for manifest in discover_local_plugins(plugins_dir)]
+
+
+def check_plugin_health(
+    plugin_dir: str, manifest: Optional[PluginManifest] = None
+) -> dict:
+    """Check the health of a plugin: manifest validity, entrypoint existence, etc.
+
+    Pass `manifest` when plugin_dir's plugin.yaml has already been parsed.
+    """
     manifest_path = os.path.join(plugin_dir, "plugin.yaml")
     status = {
         "manifest_found": False,
@@ -319,12 +612,17 @@ def check_plugin_health(plugin_dir: str) -> dict:
         "entrypoint_found": False,
         "errors": [],
     }
-    if not os.path.exists(manifest_path):
-        status["errors"].append("plugin.yaml not found")
-        return status
+    if manifest is None:
+        # One stat answers both "is it there" and "is the cached parse current"
+        try:
+            manifest_mtime = os.stat(manifest_path).st_mtime_ns
+        except OSError:
+            status["errors"].append("plugin.yaml not found")
+            return status
     status["manifest_found"] = True
     try:
-        manifest = PluginManifest(manifest_path)
+        if manifest is None:
+            manifest = _get_manifest(manifest_path, manifest_mtime)
         status["manifest_valid"] = True
         entrypoint = manifest.entrypoint
         if entrypoint:
@@ -343,12 +641,15 @@ def check_plugin_health(plugin_dir: str) -> dict:
 def install_plugin(source_path: str, plugins_dir: str) -> dict:
     """Install a plugin from a local directory. Returns status dict."""
     status = {"success": False, "errors": [], "name": None}
-    if not os.path.exists(source_path):
-        status["errors"].append(f"Source path '{source_path}' does not exist.")
-        return status
     manifest_path = os.path.join(source_path, "plugin.yaml")
-    if not os.path.exists(manifest_path):
-        status["errors"].append("plugin.yaml not found in source directory.")
+    # Stat the manifest first; the source only needs checking when it's missing
+    try:
+        os.stat(manifest_path)
+    except OSError:
+        if not os.path.exists(source_path):
+            status["errors"].append(f"Source path '{source_path}' does not exist.")
+        else:
+            status["errors"].append("plugin.yaml not found in source directory.")
         return status
     try:
         manifest = PluginManifest(manifest_path)
@@ -358,9 +659,12 @@ def install_plugin(source_path: str, plugins_dir: str) -> dict:
         if os.path.exists(dest_path):
             status["errors"].append(f"Plugin '{plugin_name}' already exists.")
             return status
-        shutil.copytree(source_path, dest_path)
-        # Validate after copy
-        health = check_plugin_health(dest_path)
+        _PLUGIN_CACHE.pop(plugins_dir, None)
+        # Clone rather than duplicate file data when the filesystem allows it;
+        # the source is left in place since it is often a working checkout
+        shutil.copytree(source_path, dest_path, copy_function=_clone_or_copy)
+        # Validate after copy; the copied manifest is the one already parsed
+        health = check_plugin_health(dest_path, manifest)
         if not (
             health["manifest_found"]
             and health["manifest_valid"]
@@ -383,8 +687,15 @@ def remove_plugin(plugin_name: str, plugins_dir: str) -> dict:
     if not os.path.exists(plugin_path):
         status["errors"].append(f"Plugin '{plugin_name}' not found.")
         return status
+    _PLUGIN_CACHE.pop(plugins_dir, None)
     try:
-        shutil.rmtree(plugin_path)
+        # Renaming within plugins_dir is O(1); the files are deleted afterwards
+        # on a background thread, along with trash left by interrupted runs
+        trash_path = os.path.join(plugins_dir, f"{_TRASH_PREFIX}{uuid4().hex}")
+        os.rename(plugin_path, trash_path)
+        threading.Thread(
+            target=_empty_trash, args=(plugins_dir,), name="ur-plugin-trash"
+        ).start()
         status["success"] = True
         return status
     except Exception as e:
@@ -395,13 +706,8 @@ def remove_plugin(plugin_name: str, plugins_dir: str) -> dict:
 def search_plugins(plugins_dir: str, query: str) -> list:
     """Search plugins by name, tag, language, or description (case-insensitive substring match)."""
     query = query.lower()
-    results = []
-    for plugin in list_plugins(plugins_dir):
-        if (
-            query in plugin["name"].lower()
-            or query in plugin["language"].lower()
-            or query in plugin["description"].lower()
-            or any(query in tag.lower() for tag in plugin["tags"])
-        ):
-            results.append(plugin)
-    return results
+    return [
+        manifest.to_dict()
+        for manifest in discover_local_plugins(plugins_dir)
+        if query in manifest.search_blob
+    ]
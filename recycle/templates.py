@@ -6,10 +6,22 @@ for different project types and configurations.
 """
 
 import os
+import sys
 import shutil
 import yaml
+from collections import defaultdict
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple, Union
+
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with it
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# list_templates() results keyed by templates_dir, with the (name, mtime)
+# of each template file they were read from
+_TEMPLATE_CACHE: Dict[
+    str, Tuple[Tuple[Tuple[str, int], ...], List[Dict[str, Any]]]
+] = {}
 
 
 def get_templates_dir() -> Path:
@@ -19,48 +31,65 @@ def get_templates_dir() -> Path:
     return current_dir / "templates"
 
 
+def _read_template(template_path: Union[str, Path]) -> Tuple[str, Any]:
+    """Read a template once, returning its first line and parsed YAML content."""
+    with open(template_path, "r", encoding="utf-8") as f:
+        text = f.read()
+    return text.partition("\n")[0].strip(), yaml.load(text, Loader=_SafeLoader)
+
+
 def list_templates() -> List[Dict[str, Any]]:
-    """List all available templates."""
+    """List all available templates.
+
+    Results are memoized per process until a template file is added, removed
+    or modified.
+    """
     templates_dir = get_templates_dir()
-    templates = []
+    templates: List[Dict[str, Any]] = []
 
-    if not templates_dir.exists():
+    try:
+        with os.scandir(templates_dir) as it:
+            entries = [
+                entry
+                for entry in it
+                if entry.name.endswith(".yaml") and entry.is_file()
+            ]
+        signature = tuple((entry.name, entry.stat().st_mtime_ns) for entry in entries)
+    except OSError:
         return templates
 
-    for template_file in templates_dir.glob("*.yaml"):
-        if template_file.name == "__init__.py":
-            continue
+    cached = _TEMPLATE_CACHE.get(str(templates_dir))
+    if cached is not None and cached[0] == signature:
+        return list(cached[1])
 
-        template_name = template_file.stem
-        template_path = template_file
+    for entry in entries:
+        template_name = entry.name[: -len(".yaml")]
+        template_path = Path(entry.path)
 
-        # Read template to get description
+        # Read template once for both the description and the YAML content
         try:
-            with open(template_path, "r") as f:
-                content = yaml.safe_load(f)
-                repos = content.get("repositories", [])
-
-                # Extract languages used
-                languages = list(set(repo.get("language", "unknown") for repo in repos))
-
-                # Get first line comment as description
-                with open(template_path, "r") as f:
-                    first_line = f.readline().strip()
-                    description = (
-                        first_line.replace("# ", "")
-                        if first_line.startswith("#")
-                        else f"{len(repos)} repositories"
-                    )
-
-                templates.append(
-                    {
-                        "name": template_name,
-                        "description": description,
-                        "languages": languages,
-                        "repo_count": len(repos),
-                        "path": template_path,
-                    }
-                )
+            first_line, content = _read_template(entry.path)
+            repos = content.get("repositories", [])
+
+            # Extract languages used
+            languages = list({repo.get("language", "unknown") for repo in repos})
+
+            # Get first line comment as description
+            description = (
+                first_line.replace("# ", "")
+                if first_line.startswith("#")
+                else f"{len(repos)} repositories"
+            )
+
+            templates.append(
+                {
+                    "name": template_name,
+                    "description": description,
+                    "languages": languages,
+                    "repo_count": len(repos),
+                    "path": template_path,
+                }
+            )
         except Exception as e:
             # Fallback if template can't be parsed
             templates.append(
@@ -73,7 +102,8 @@ def list_templates() -> List[Dict[str, Any]]:
                 }
             )
 
-    return templates
+    _TEMPLATE_CACHE[str(templates_dir)] = (signature, templates)
+    return list(templates)
 
 
 def copy_template(template_name: str, output_path: str = "repos.yaml") -> bool:
@@ -88,8 +118,13 @@ def copy_template(template_name: str, output_path: str = "repos.yaml") -> bool:
             print(f"  - {template['name']}: {template['description']}")
         return False
 
+    # Like shutil.copy2, copying into a directory keeps the template's filename
+    if os.path.isdir(output_path):
+        output_path = os.path.join(output_path, template_path.name)
+
     try:
-        shutil.copy2(template_path, output_path)
+        # Only the contents matter for a fresh manifest; skip copying metadata
+        shutil.copyfile(template_path, output_path)
         print(f"✓ Template '{template_name}' copied to {output_path}")
         return True
     except Exception as e:
@@ -107,42 +142,37 @@ def print_template_info(template_name: str) -> bool:
         return False
 
     try:
-        with open(template_path, "r") as f:
-            content = yaml.safe_load(f)
-            repos = content.get("repositories", [])
+        first_line, content = _read_template(template_path)
+        repos = content.get("repositories", [])
+
+        # Collect the report and write it in one go
+        out = [f"\nTemplate: {template_name}", "=" * (len(template_name) + 9)]
+
+        # Print description from first line
+        if first_line.startswith("# "):
+            out.append(f"Description: {first_line[2:]}")
+
+        out.append(f"Repositories: {len(repos)}")
+
+        # Group by language
+        by_language = defaultdict(list)
+        for repo in repos:
+            by_language[repo.get("language", "unknown")].append(repo)
+
+        out.append("\nRepositories by language:")
+        for lang, lang_repos in by_language.items():
+            out.append(f"  {lang.upper()} ({len(lang_repos)}):")
+            for repo in lang_repos:
+                adapters = ", ".join(repo.get("adapters", []))
+                bindings = ", ".join(repo.get("bindings", []))
+                out.append(
+                    f"    - {repo['name']}: {repo.get('description', 'No description')}"
+                )
+                out.append(f"      Adapters: {adapters}")
+                out.append(f"      Bindings: {bindings}")
 
-            print(f"\nTemplate: {template_name}")
-            print("=" * (len(template_name) + 9))
-
-            # Print description from first line
-            with open(template_path, "r") as f:
-                first_line = f.readline().strip()
-                if first_line.startswith("# "):
-                    print(f"Description: {first_line[2:]}")
-
-            print(f"Repositories: {len(repos)}")
-
-            # Group by language
-            by_language = {}
-            for repo in repos:
-                lang = repo.get("language", "unknown")
-                if lang not in by_language:
-                    by_language[lang] = []
-                by_language[lang].append(repo)
-
-            print("\nRepositories by language:")
-            for lang, lang_repos in by_language.items():
-                print(f"  {lang.upper()} ({len(lang_repos)}):")
-                for repo in lang_repos:
-                    adapters = ", ".join(repo.get("adapters", []))
-                    bindings = ", ".join(repo.get("bindings", []))
-                    print(
-                        f"    - {repo['name']}: {repo.get('description', 'No description')}"
-                    )
-                    print(f"      Adapters: {adapters}")
-                    print(f"      Bindings: {bindings}")
-
-            return True
+        sys.stdout.write("\n".join(out) + "\n")
+        return True
 
     except Exception as e:
         print(f"✗ Failed to read template: {e}")
@@ -155,12 +185,19 @@ def create_custom_template(repos: List[Dict[str, Any]], template_name: str) -> b
     templates_dir.mkdir(exist_ok=True)
 
     template_path = templates_dir / f"{template_name}.yaml"
+    _TEMPLATE_CACHE.clear()
 
     try:
         content = {"repositories": repos}
 
         with open(template_path, "w") as f:
-            yaml.dump(content, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(
+                content,
+                f,
+                Dumper=_SafeDumper,
+                default_flow_style=False,
+                sort_keys=False,
+            )
 
         print(f"✓ Custom template '{template_name}' created at {template_path}")
         return True
@@ -6,9 +6,70 @@ with helpful error messages and suggestions.
 """
 
 import os
+import sys
+import json
+import hashlib
 import yaml
-from typing import Dict, List, Any, Tuple, Optional
+from typing import Callable, Dict, List, Any, NamedTuple, Tuple, Optional
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Allowed values, in the order they are listed in error messages
+_LANGUAGES = ("python", "cpp", "rust", "go", "wasm")
+_ADAPTERS = (
+    "ruff",
+    "mypy",
+    "clang-tidy",
+    "vcpkg",
+    "cargo-check",
+    "cargo-fmt",
+    "go-fmt",
+    "go-vet",
+    "wasm-pack",
+    "wasm-bindgen",
+)
+_BINDINGS = ("pybind11", "pyo3", "cgo", "wasm", "grpc")
+_BACKENDS = ("local", "redis", "s3", "gcs")
+_ENDPOINTS = ("pypi", "npm", "vcpkg", "crates.io", "go_modules")
+
+_VALID_LANGUAGES = frozenset(_LANGUAGES)
+_VALID_ADAPTERS = frozenset(_ADAPTERS)
+_VALID_BINDINGS = frozenset(_BINDINGS)
+_VALID_BACKENDS = frozenset(_BACKENDS)
+_VALID_ENDPOINTS = frozenset(_ENDPOINTS)
+
+_LANGUAGES_MSG = ", ".join(_LANGUAGES)
+_ADAPTERS_MSG = ", ".join(_ADAPTERS)
+_BINDINGS_MSG = ", ".join(_BINDINGS)
+_BACKENDS_MSG = ", ".join(_BACKENDS)
+_ENDPOINTS_MSG = ", ".join(_ENDPOINTS)
+
+# On-disk cache of validation results, keyed by config content hash. Bump the
+# version whenever the validation rules change.
+VALIDATION_CACHE_DIR = Path.home() / ".cache" / "universal_recycle" / "validation"
+_VALIDATION_CACHE_VERSION = 2
+
+
+class ValidationMessage(NamedTuple):
+    """A validation error whose text is only formatted when it is displayed.
+
+    ``code`` identifies the kind of error for :func:`suggest_fixes`.
+    """
+
+    template: str
+    args: tuple = ()
+    code: Optional[str] = None
+
+    def __str__(self) -> str:
+        return self.template % self.args if self.args else self.template
+
+    @property
+    def is_error(self) -> bool:
+        """False for notes about the validation itself, e.g. truncation."""
+        return self.code != "truncated"
 
 
 class ValidationError(Exception):
@@ -26,19 +87,30 @@ class ValidationError(Exception):
         super().__init__(self.message)
 
 
-def validate_repos_manifest(manifest_path: str) -> Tuple[bool, List[str]]:
-    """Validate a repos.yaml manifest file."""
+def validate_repos_manifest(
+    manifest_path: str,
+    max_errors: int = 50,
+) -> Tuple[bool, List[ValidationMessage]]:
+    """Validate a repos.yaml manifest file.
+
+    Validation stops after ``max_errors`` errors so that a badly malformed
+    manifest doesn't bury the first problems under derivative ones.
+    """
     errors = []
 
     if not os.path.exists(manifest_path):
-        errors.append(f"Manifest file not found: {manifest_path}")
+        errors.append(
+            ValidationMessage("Manifest file not found: %s", (manifest_path,))
+        )
         return False, errors
 
     try:
-        with open(manifest_path, "r") as f:
-            data = yaml.safe_load(f)
+        with open(manifest_path, "rb") as f:
+            data = yaml.load(f, Loader=_SafeLoader)
     except yaml.YAMLError as e:
-        errors.append(f"Invalid YAML syntax: {e}")
+        errors.append(
+            ValidationMessage("Invalid YAML syntax: %s", (e,), code="yaml_syntax")
+        )
         return False, errors
 
     # Handle both old and new manifest formats
@@ -48,19 +120,38 @@ def validate_repos_manifest(manifest_path: str) -> Tuple[bool, List[str]]:
         repos = data["repositories"]
     else:
         errors.append(
-            "Invalid manifest format. Expected list of repositories or {repositories: [...]}"
+            ValidationMessage(
+                "Invalid manifest format. Expected list of repositories or {repositories: [...]}"
+            )
         )
         return False, errors
 
     if not repos:
-        errors.append("No repositories defined in manifest")
+        errors.append(
+            ValidationMessage(
+                "No repositories defined in manifest", code="no_repositories"
+            )
+        )
         return False, errors
 
     # Validate each repository
     for i, repo in enumerate(repos):
+        if len(errors) >= max_errors:
+            errors.append(
+                ValidationMessage(
+                    "... (truncated after %d errors, %d repositories not checked)",
+                    (len(errors), len(repos) - i),
+                    code="truncated",
+                )
+            )
+            break
+
         if not isinstance(repo, dict):
             errors.append(
-                f"Repository {i+1}: Expected dictionary, got {type(repo).__name__}"
+                ValidationMessage(
+                    "Repository %d: Expected dictionary, got %s",
+                    (i + 1, type(repo).__name__),
+                )
             )
             continue
 
@@ -68,124 +159,159 @@ def validate_repos_manifest(manifest_path: str) -> Tuple[bool, List[str]]:
         required_fields = ["name", "language", "git"]
         for field in required_fields:
             if field not in repo:
-                errors.append(f"Repository {i+1}: Missing required field '{field}'")
+                errors.append(
+                    ValidationMessage(
+                        "Repository %d: Missing required field '%s'",
+                        (i + 1, field),
+                        code="missing_field",
+                    )
+                )
                 continue
 
         # Validate name
         name = repo.get("name", "")
         if not name or not isinstance(name, str):
-            errors.append(f"Repository {i+1}: Invalid name '{name}'")
+            errors.append(
+                ValidationMessage("Repository %d: Invalid name '%s'", (i + 1, name))
+            )
 
         # Validate language
         language = repo.get("language", "")
-        valid_languages = ["python", "cpp", "rust", "go", "wasm"]
-        if language not in valid_languages:
+        if language not in _VALID_LANGUAGES:
             errors.append(
-                f"Repository {i+1}: Invalid language '{language}'. Valid options: {', '.join(valid_languages)}"
+                ValidationMessage(
+                    "Repository %d: Invalid language '%s'. Valid options: %s",
+                    (i + 1, language, _LANGUAGES_MSG),
+                    code="invalid_language",
+                )
             )
 
         # Validate git URL
         git_url = repo.get("git", "")
         if not git_url or not isinstance(git_url, str):
-            errors.append(f"Repository {i+1}: Invalid git URL '{git_url}'")
+            errors.append(
+                ValidationMessage(
+                    "Repository %d: Invalid git URL '%s'",
+                    (i + 1, git_url),
+                    code="invalid_git_url",
+                )
+            )
         elif not (git_url.startswith("http") or git_url.startswith("git@")):
             errors.append(
-                f"Repository {i+1}: Git URL should start with 'http' or 'git@': {git_url}"
+                ValidationMessage(
+                    "Repository %d: Git URL should start with 'http' or 'git@': %s",
+                    (i + 1, git_url),
+                )
             )
 
         # Validate commit (optional)
         commit = repo.get("commit", "")
         if commit and not isinstance(commit, str):
-            errors.append(f"Repository {i+1}: Invalid commit '{commit}'")
+            errors.append(
+                ValidationMessage("Repository %d: Invalid commit '%s'", (i + 1, commit))
+            )
 
         # Validate adapters (optional)
         adapters = repo.get("adapters", [])
         if adapters and not isinstance(adapters, list):
             errors.append(
-                f"Repository {i+1}: Adapters should be a list, got {type(adapters).__name__}"
+                ValidationMessage(
+                    "Repository %d: Adapters should be a list, got %s",
+                    (i + 1, type(adapters).__name__),
+                )
             )
         elif adapters:
-            valid_adapters = [
-                "ruff",
-                "mypy",
-                "clang-tidy",
-                "vcpkg",
-                "cargo-check",
-                "cargo-fmt",
-                "go-fmt",
-                "go-vet",
-                "wasm-pack",
-                "wasm-bindgen",
-            ]
             for adapter in adapters:
-                if adapter not in valid_adapters:
+                if adapter not in _VALID_ADAPTERS:
                     errors.append(
-                        f"Repository {i+1}: Unknown adapter '{adapter}'. Valid options: {', '.join(valid_adapters)}"
+                        ValidationMessage(
+                            "Repository %d: Unknown adapter '%s'. Valid options: %s",
+                            (i + 1, adapter, _ADAPTERS_MSG),
+                            code="unknown_adapter",
+                        )
                     )
 
         # Validate bindings (optional)
         bindings = repo.get("bindings", [])
         if bindings and not isinstance(bindings, list):
             errors.append(
-                f"Repository {i+1}: Bindings should be a list, got {type(bindings).__name__}"
+                ValidationMessage(
+                    "Repository %d: Bindings should be a list, got %s",
+                    (i + 1, type(bindings).__name__),
+                )
             )
         elif bindings:
-            valid_bindings = ["pybind11", "pyo3", "cgo", "wasm", "grpc"]
             for binding in bindings:
-                if binding not in valid_bindings:
+                if binding not in _VALID_BINDINGS:
                     errors.append(
-                        f"Repository {i+1}: Unknown binding '{binding}'. Valid options: {', '.join(valid_bindings)}"
+                        ValidationMessage(
+                            "Repository %d: Unknown binding '%s'. Valid options: %s",
+                            (i + 1, binding, _BINDINGS_MSG),
+                            code="unknown_binding",
+                        )
                     )
 
     return len(errors) == 0, errors
 
 
-def validate_cache_config(config_path: str) -> Tuple[bool, List[str]]:
+def validate_cache_config(
+    config_path: str,
+) -> Tuple[bool, List[ValidationMessage]]:
     """Validate a cache_config.yaml file."""
     errors = []
 
     if not os.path.exists(config_path):
-        errors.append(f"Cache config file not found: {config_path}")
+        errors.append(
+            ValidationMessage("Cache config file not found: %s", (config_path,))
+        )
         return False, errors
 
     try:
-        with open(config_path, "r") as f:
-            data = yaml.safe_load(f)
+        with open(config_path, "rb") as f:
+            data = yaml.load(f, Loader=_SafeLoader)
     except yaml.YAMLError as e:
-        errors.append(f"Invalid YAML syntax: {e}")
+        errors.append(
+            ValidationMessage("Invalid YAML syntax: %s", (e,), code="yaml_syntax")
+        )
         return False, errors
 
     if not isinstance(data, dict):
-        errors.append("Cache config should be a dictionary")
+        errors.append(ValidationMessage("Cache config should be a dictionary"))
         return False, errors
 
     # Validate backends
     backends = data.get("backends", [])
     if not isinstance(backends, list):
-        errors.append("Backends should be a list")
+        errors.append(ValidationMessage("Backends should be a list"))
         return False, errors
 
     if not backends:
-        errors.append("No cache backends configured")
+        errors.append(ValidationMessage("No cache backends configured"))
         return False, errors
 
-    valid_backend_types = ["local", "redis", "s3", "gcs"]
-
     for i, backend in enumerate(backends):
         if not isinstance(backend, dict):
             errors.append(
-                f"Backend {i+1}: Expected dictionary, got {type(backend).__name__}"
+                ValidationMessage(
+                    "Backend %d: Expected dictionary, got %s",
+                    (i + 1, type(backend).__name__),
+                )
             )
             continue
 
         backend_type = backend.get("type")
         if not backend_type:
-            errors.append(f"Backend {i+1}: Missing 'type' field")
+            errors.append(
+                ValidationMessage("Backend %d: Missing 'type' field", (i + 1,))
+            )
             continue
 
-        if backend_type not in valid_backend_types:
+        if backend_type not in _VALID_BACKENDS:
             errors.append(
-                f"Backend {i+1}: Invalid type '{backend_type}'. Valid options: {', '.join(valid_backend_types)}"
+                ValidationMessage(
+                    "Backend %d: Invalid type '%s'. Valid options: %s",
+                    (i + 1, backend_type, _BACKENDS_MSG),
+                )
             )
             continue
 
@@ -194,7 +320,10 @@ def validate_cache_config(config_path: str) -> Tuple[bool, List[str]]:
             cache_dir = backend.get("cache_dir")
             if not cache_dir:
                 errors.append(
-                    f"Backend {i+1}: Local backend requires 'cache_dir' field"
+                    ValidationMessage(
+                        "Backend %d: Local backend requires 'cache_dir' field",
+                        (i + 1,),
+                    )
                 )
 
         elif backend_type == "redis":
@@ -202,68 +331,94 @@ def validate_cache_config(config_path: str) -> Tuple[bool, List[str]]:
             for field in required_fields:
                 if field not in backend:
                     errors.append(
-                        f"Backend {i+1}: Redis backend requires '{field}' field"
+                        ValidationMessage(
+                            "Backend %d: Redis backend requires '%s' field",
+                            (i + 1, field),
+                        )
                     )
 
         elif backend_type == "s3":
             required_fields = ["bucket_name", "region_name"]
             for field in required_fields:
                 if field not in backend:
-                    errors.append(f"Backend {i+1}: S3 backend requires '{field}' field")
+                    errors.append(
+                        ValidationMessage(
+                            "Backend %d: S3 backend requires '%s' field",
+                            (i + 1, field),
+                        )
+                    )
 
         elif backend_type == "gcs":
             required_fields = ["bucket_name", "project_id"]
             for field in required_fields:
                 if field not in backend:
                     errors.append(
-                        f"Backend {i+1}: GCS backend requires '{field}' field"
+                        ValidationMessage(
+                            "Backend %d: GCS backend requires '%s' field",
+                            (i + 1, field),
+                        )
                     )
 
     return len(errors) == 0, errors
 
 
-def validate_distribution_config(config_path: str) -> Tuple[bool, List[str]]:
+def validate_distribution_config(
+    config_path: str,
+) -> Tuple[bool, List[ValidationMessage]]:
     """Validate a distribution_config.yaml file."""
     errors = []
 
     if not os.path.exists(config_path):
-        errors.append(f"Distribution config file not found: {config_path}")
+        errors.append(
+            ValidationMessage("Distribution config file not found: %s", (config_path,))
+        )
         return False, errors
 
     try:
-        with open(config_path, "r") as f:
-            data = yaml.safe_load(f)
+        with open(config_path, "rb") as f:
+            data = yaml.load(f, Loader=_SafeLoader)
     except yaml.YAMLError as e:
-        errors.append(f"Invalid YAML syntax: {e}")
+        errors.append(
+            ValidationMessage("Invalid YAML syntax: %s", (e,), code="yaml_syntax")
+        )
         return False, errors
 
     if not isinstance(data, dict):
-        errors.append("Distribution config should be a dictionary")
+        errors.append(ValidationMessage("Distribution config should be a dictionary"))
         return False, errors
 
     # Validate endpoints
     endpoints = data.get("endpoints", {})
     if not isinstance(endpoints, dict):
-        errors.append("Endpoints should be a dictionary")
+        errors.append(ValidationMessage("Endpoints should be a dictionary"))
         return False, errors
 
-    valid_endpoint_types = ["pypi", "npm", "vcpkg", "crates.io", "go_modules"]
-
     for endpoint_name, endpoint_config in endpoints.items():
         if not isinstance(endpoint_config, dict):
             errors.append(
-                f"Endpoint '{endpoint_name}': Expected dictionary, got {type(endpoint_config).__name__}"
+                ValidationMessage(
+                    "Endpoint '%s': Expected dictionary, got %s",
+                    (endpoint_name, type(endpoint_config).__name__),
+                )
             )
             continue
 
         endpoint_type = endpoint_config.get("type")
         if not endpoint_type:
-            errors.append(f"Endpoint '{endpoint_name}': Missing 'type' field")
+            errors.append(
+                ValidationMessage(
+                    "Endpoint '%s': Missing 'type' field",
+                    (endpoint_name,),
+                )
+            )
             continue
 
-        if endpoint_type not in valid_endpoint_types:
+        if endpoint_type not in _VALID_ENDPOINTS:
             errors.append(
-                f"Endpoint '{endpoint_name}': Invalid type '{endpoint_type}'. Valid options: {', '.join(valid_endpoint_types)}"
+                ValidationMessage(
+                    "Endpoint '%s': Invalid type '%s'. Valid options: %s",
+                    (endpoint_name, endpoint_type, _ENDPOINTS_MSG),
+                )
             )
             continue
 
@@ -276,14 +431,20 @@ def validate_distribution_config(config_path: str) -> Tuple[bool, List[str]]:
             registry = endpoint_config.get("credentials", {}).get("registry")
             if not registry:
                 errors.append(
-                    f"Endpoint '{endpoint_name}': npm endpoint should specify registry in credentials"
+                    ValidationMessage(
+                        "Endpoint '%s': npm endpoint should specify registry in credentials",
+                        (endpoint_name,),
+                    )
                 )
 
         elif endpoint_type == "vcpkg":
             registry_url = endpoint_config.get("credentials", {}).get("registry_url")
             if not registry_url:
                 errors.append(
-                    f"Endpoint '{endpoint_name}': vcpkg endpoint should specify registry_url in credentials"
+                    ValidationMessage(
+                        "Endpoint '%s': vcpkg endpoint should specify registry_url in credentials",
+                        (endpoint_name,),
+                    )
                 )
 
         elif endpoint_type == "crates.io":
@@ -297,31 +458,101 @@ def validate_distribution_config(config_path: str) -> Tuple[bool, List[str]]:
     return len(errors) == 0, errors
 
 
+def _validate_cached(
+    path: str,
+    validator: Callable[[str], Tuple[bool, List[ValidationMessage]]],
+) -> Tuple[bool, List[ValidationMessage]]:
+    """Run a validator, reusing a stored result when the file is unchanged.
+
+    Results are keyed by the validator and a hash of the file's path and
+    contents (messages may mention the path).
+    """
+    try:
+        data = Path(path).read_bytes()
+    except OSError:
+        # Let the validator report the missing/unreadable file
+        return validator(path)
+
+    hasher = hashlib.blake2b(os.path.abspath(path).encode(), digest_size=16)
+    hasher.update(b"\0")
+    hasher.update(data)
+    digest = hasher.hexdigest()
+    cache_file = (
+        VALIDATION_CACHE_DIR
+        / f"{validator.__name__}-v{_VALIDATION_CACHE_VERSION}-{digest}.json"
+    )
+
+    try:
+        with open(cache_file, "r") as f:
+            cached = json.load(f)
+        errors = [
+            ValidationMessage(template, tuple(args), code)
+            for template, args, code in cached["errors"]
+        ]
+        return cached["valid"], errors
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    valid, errors = validator(path)
+
+    # Store arguments as JSON scalars; anything else keeps its %s rendering
+    serialized = [
+        [
+            error.template,
+            [
+                arg if arg is None or isinstance(arg, (str, int, float)) else str(arg)
+                for arg in error.args
+            ],
+            error.code,
+        ]
+        for error in errors
+    ]
+    try:
+        VALIDATION_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, "w") as f:
+            json.dump({"valid": valid, "errors": serialized}, f)
+    except OSError:
+        pass
+
+    return valid, errors
+
+
 def validate_all_configs(
     manifest_path: str,
     cache_config_path: Optional[str] = None,
     distribution_config_path: Optional[str] = None,
-) -> Tuple[bool, Dict[str, List[str]]]:
-    """Validate all configuration files."""
-    all_errors = {}
-
-    # Validate manifest
-    manifest_valid, manifest_errors = validate_repos_manifest(manifest_path)
-    all_errors["manifest"] = manifest_errors
-
-    # Validate cache config if provided
-    if cache_config_path:
-        cache_valid, cache_errors = validate_cache_config(cache_config_path)
-        all_errors["cache"] = cache_errors
-    else:
-        all_errors["cache"] = []
+    use_cache: bool = True,
+) -> Tuple[bool, Dict[str, List[ValidationMessage]]]:
+    """Validate all configuration files.
+
+    The validators are independent file reads and parses, so they run
+    concurrently. With ``use_cache``, results for unchanged files are
+    reused from ``VALIDATION_CACHE_DIR``.
+    """
+    all_errors: Dict[str, List[ValidationMessage]] = {
+        "manifest": [],
+        "cache": [],
+        "distribution": [],
+    }
+
+    def submit(validator, path):
+        if use_cache:
+            return executor.submit(_validate_cached, path, validator)
+        return executor.submit(validator, path)
+
+    with ThreadPoolExecutor(max_workers=len(all_errors)) as executor:
+        futures = {"manifest": submit(validate_repos_manifest, manifest_path)}
+
+        # Validate cache and distribution configs if provided
+        if cache_config_path:
+            futures["cache"] = submit(validate_cache_config, cache_config_path)
+        if distribution_config_path:
+            futures["distribution"] = submit(
+                validate_distribution_config, distribution_config_path
+            )
 
-    # Validate distribution config if provided
-    if distribution_config_path:
-        dist_valid, dist_errors = validate_distribution_config(distribution_config_path)
-        all_errors["distribution"] = dist_errors
-    else:
-        all_errors["distribution"] = []
+        for config_type, future in futures.items():
+            _, all_errors[config_type] = future.result()
 
     # Check if all validations passed
     all_valid = all(len(errors) == 0 for errors in all_errors.values())
@@ -329,69 +560,70 @@ def validate_all_configs(
     return all_valid, all_errors
 
 
-def print_validation_errors(errors: Dict[str, List[str]]):
-    """Print validation errors in a user-friendly format."""
-    from colors import print_error, print_warning, print_info
+def print_validation_errors(errors: Dict[str, List[ValidationMessage]]):
+    """Print validation errors in a user-friendly format.
 
-    total_errors = sum(len(error_list) for error_list in errors.values())
+    Messages are formatted here rather than when the error is recorded.
+    """
+    from colors import error_line, info_line, print_info, warning_line
+
+    total_errors = sum(
+        error.is_error for error_list in errors.values() for error in error_list
+    )
 
     if total_errors == 0:
         print_info("All configuration files are valid!")
         return
 
-    print_error(f"Found {total_errors} validation error(s):")
+    out = [error_line(f"Found {total_errors} validation error(s):")]
 
     for config_type, error_list in errors.items():
         if error_list:
-            print_warning(f"\n{config_type.upper()} Configuration:")
+            out.append(warning_line(f"\n{config_type.upper()} Configuration:"))
             for error in error_list:
-                print_error(f"  • {error}")
+                if error.is_error:
+                    out.append(error_line(f"  • {error}"))
+                else:
+                    out.append(info_line(f"  {error}"))
 
+    sys.stdout.write("\n".join(out) + "\n")
 
-def suggest_fixes(errors: Dict[str, List[str]]) -> Dict[str, List[str]]:
-    """Generate suggestions for fixing validation errors."""
-    suggestions = {}
 
-    for config_type, error_list in errors.items():
-        config_suggestions = []
+def _default_suggestion(*args: Any) -> str:
+    return "Review the configuration format in the documentation"
 
-        for error in error_list:
-            if "Missing required field" in error:
-                field = error.split("'")[1] if "'" in error else "field"
-                config_suggestions.append(f"Add the missing '{field}' field")
 
-            elif "Invalid language" in error:
-                config_suggestions.append("Use one of: python, cpp, rust, go, wasm")
+# Suggestion builders keyed by ValidationMessage.code; each receives the
+# message args
+_SUGGESTIONS: Dict[str, Callable[..., str]] = {
+    "missing_field": lambda index, field: f"Add the missing '{field}' field",
+    "invalid_language": lambda *args: f"Use one of: {_LANGUAGES_MSG}",
+    "unknown_adapter": lambda *args: f"Use valid adapters: {_ADAPTERS_MSG}",
+    "unknown_binding": lambda *args: f"Use valid bindings: {_BINDINGS_MSG}",
+    "invalid_git_url": lambda *args: (
+        "Use a valid git URL starting with 'http' or 'git@'"
+    ),
+    "yaml_syntax": lambda *args: "Check your YAML syntax, ensure proper indentation",
+    "no_repositories": lambda *args: "Add at least one repository to your manifest",
+}
 
-            elif "Unknown adapter" in error:
-                config_suggestions.append(
-                    "Use valid adapters: ruff, mypy, clang-tidy, vcpkg, cargo-check, cargo-fmt, go-fmt, go-vet, wasm-pack, wasm-bindgen"
-                )
-
-            elif "Unknown binding" in error:
-                config_suggestions.append(
-                    "Use valid bindings: pybind11, pyo3, cgo, wasm, grpc"
-                )
-
-            elif "Invalid git URL" in error:
-                config_suggestions.append(
-                    "Use a valid git URL starting with 'http' or 'git@'"
-                )
 
-            elif "Invalid YAML syntax" in error:
-                config_suggestions.append(
-                    "Check your YAML syntax, ensure proper indentation"
-                )
+def suggest_fixes(
+    errors: Dict[str, List[ValidationMessage]],
+) -> Dict[str, List[str]]:
+    """Generate suggestions for fixing validation errors."""
+    suggestions = {}
 
-            elif "No repositories defined" in error:
-                config_suggestions.append(
-                    "Add at least one repository to your manifest"
-                )
+    for config_type, error_list in errors.items():
+        config_suggestions = []
 
-            else:
-                config_suggestions.append(
-                    "Review the configuration format in the documentation"
-                )
+        for error in error_list:
+            if not error.is_error:
+                continue
+            suggest = _default_suggestion
+            if error.code is not None:
+                suggest = _SUGGESTIONS.get(error.code, _default_suggestion)
+            config_suggestions.append(suggest(*error.args))
 
         if config_suggestions:
             suggestions[config_type] = config_suggestions
@@ -401,14 +633,16 @@ def suggest_fixes(errors: Dict[str, List[str]]) -> Dict[str, List[str]]:
 
 def print_suggestions(suggestions: Dict[str, List[str]]):
     """Print suggestions for fixing validation errors."""
-    from colors import print_info
+    from colors import info_line
 
     if not suggestions:
         return
 
-    print_info("\nSuggestions to fix the errors:")
+    out = [info_line("\nSuggestions to fix the errors:")]
 
     for config_type, suggestion_list in suggestions.items():
-        print_info(f"\n{config_type.upper()} Configuration:")
+        out.append(info_line(f"\n{config_type.upper()} Configuration:"))
         for suggestion in suggestion_list:
-            print(f"  • {suggestion}")
+            out.append(f"  • {suggestion}")
+
+    sys.stdout.write("\n".join(out) + "\n")
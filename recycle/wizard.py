@@ -5,13 +5,71 @@ This module provides an interactive CLI wizard to help new users
 set up their Universal Recycle project with minimal friction.
 """
 
+import io
 import os
-import yaml
 import sys
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import product
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import IO, Callable, Dict, Iterator, List, Any, Optional, Tuple
 import re
 
+_LANGUAGES = ("python", "cpp", "rust", "go", "wasm")
+
+# Suggested adapters and bindings per language, and the full menus
+_ADAPTER_MAP = {
+    "python": ("ruff", "mypy"),
+    "cpp": ("clang-tidy", "vcpkg"),
+    "rust": ("cargo-check", "cargo-fmt"),
+    "go": ("go-fmt", "go-vet"),
+    "wasm": ("wasm-pack", "wasm-bindgen"),
+}
+_BINDING_MAP = {
+    "python": ("grpc",),
+    "cpp": ("pybind11", "grpc"),
+    "rust": ("pyo3", "wasm", "grpc"),
+    "go": ("cgo", "grpc"),
+    "wasm": ("wasm",),
+}
+_ALL_ADAPTERS = (
+    "ruff",
+    "mypy",
+    "clang-tidy",
+    "vcpkg",
+    "cargo-check",
+    "cargo-fmt",
+    "go-fmt",
+    "go-vet",
+    "wasm-pack",
+    "wasm-bindgen",
+)
+_ALL_BINDINGS = ("pybind11", "pyo3", "cgo", "wasm", "grpc")
+
+# A comma-separated list of menu numbers, e.g. "1, 3,4"
+_CSV_INT = re.compile(r"^\s*\d+(?:\s*,\s*\d+)*\s*$")
+
+# Parsed config files, stored as JSON and keyed by a hash of the file contents
+CONFIG_CACHE_DIR = Path.home() / ".cache" / "universal_recycle" / "configs"
+_CONFIG_CACHE_VERSION = 2
+
+_json_loads: Callable[[bytes], Any]
+_json_dumps: Callable[[Any], bytes]
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    import json
+
+    def _stdlib_json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    _json_loads = json.loads
+    _json_dumps = _stdlib_json_dumps
+
 
 class Colors:
     """ANSI color codes for rich CLI output."""
@@ -27,104 +85,203 @@ class Colors:
     UNDERLINE = "\033[4m"
 
 
+# Prefixes for the print_* helpers, joined once instead of on every call
+_HEADER = "\n" + Colors.HEADER + Colors.BOLD
+_SUCCESS = Colors.OKGREEN + "✓ "
+_WARNING = Colors.WARNING + "⚠ "
+_ERROR = Colors.FAIL + "✗ "
+_INFO = Colors.OKBLUE + "ℹ "
+_END = Colors.ENDC
+
+
 def print_header(text: str):
     """Print a formatted header."""
-    print(f"\n{Colors.HEADER}{Colors.BOLD}{text}{Colors.ENDC}")
+    print(_HEADER + text + _END)
     print("=" * len(text))
 
 
 def print_success(text: str):
     """Print a success message."""
-    print(f"{Colors.OKGREEN}✓ {text}{Colors.ENDC}")
+    print(_SUCCESS + text + _END)
 
 
 def print_warning(text: str):
     """Print a warning message."""
-    print(f"{Colors.WARNING}⚠ {text}{Colors.ENDC}")
+    print(_WARNING + text + _END)
 
 
 def print_error(text: str):
     """Print an error message."""
-    print(f"{Colors.FAIL}✗ {text}{Colors.ENDC}")
+    print(_ERROR + text + _END)
 
 
 def print_info(text: str):
     """Print an info message."""
-    print(f"{Colors.OKBLUE}ℹ {text}{Colors.ENDC}")
+    print(_INFO + text + _END)
+
+
+def _print_menu(options) -> None:
+    """Print numbered options with a single write."""
+    sys.stdout.write(
+        "".join(f"  {i}. {option}\n" for i, option in enumerate(options, 1))
+    )
+
+
+def _pick_options(choice: str, options: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Options named by a validated comma-separated list of 1-based numbers.
+
+    Numbers outside the menu are ignored.
+    """
+    return tuple(
+        options[i - 1] for i in map(int, choice.split(",")) if 0 < i <= len(options)
+    )
+
+
+# Remaining lines of a piped stdin while the wizard runs; None reads from input()
+_stdin_lines: Optional[Iterator[str]] = None
+
+
+def _read_line(prompt: str) -> str:
+    """input() replacement that serves piped answers from the bulk buffer."""
+    if _stdin_lines is None:
+        return input(prompt)
+    sys.stdout.write(prompt)
+    line = next(_stdin_lines, None)
+    if line is None:
+        raise EOFError
+    return line[:-1] if line.endswith("\n") else line
 
 
 def get_user_input(prompt: str, default: str = "", required: bool = True) -> str:
     """Get user input with optional default value."""
     while True:
         if default:
-            user_input = input(f"{prompt} [{default}]: ").strip()
+            user_input = _read_line(f"{prompt} [{default}]: ").strip()
             if not user_input:
                 user_input = default
         else:
-            user_input = input(f"{prompt}: ").strip()
+            user_input = _read_line(f"{prompt}: ").strip()
 
         if not required or user_input:
             return user_input
         print_error("This field is required. Please enter a value.")
 
 
+def _case_variants(*words: str) -> frozenset:
+    """Every upper/lower case spelling of ``words``."""
+    return frozenset(
+        "".join(chars)
+        for word in words
+        for chars in product(*((c.lower(), c.upper()) for c in word))
+    )
+
+
+# Accepted answers in any case, so responses need no case conversion
+_YES = _case_variants("y", "yes")
+_NO = _case_variants("n", "no")
+
+
 def get_yes_no(prompt: str, default: str = "Y") -> bool:
     """Get a yes/no response from the user."""
     while True:
-        response = get_user_input(prompt, default, required=False).upper()
-        if response in ["Y", "YES"]:
+        response = get_user_input(prompt, default, required=False)
+        if response in _YES:
             return True
-        elif response in ["N", "NO"]:
+        elif response in _NO:
             return False
         print_error("Please enter 'Y' or 'N'.")
 
 
-def detect_language_from_url(url: str) -> Optional[str]:
-    """Attempt to detect language from repository URL or name."""
-    url_lower = url.lower()
+# Language hints in repository URLs and names, checked in this order; the
+# first language with any substring hit wins
+_LANG_HINTS = (
+    ("python", ("python", "py-", "-py")),
+    ("cpp", ("cpp", "c++", "cxx")),
+    ("rust", ("rust", "rs-", "-rs")),
+    ("go", ("go-", "-go", "golang")),
+    ("wasm", ("wasm", "webassembly")),
+)
 
-    # Check for language-specific patterns in URL
-    if any(pattern in url_lower for pattern in ["python", "py-", "-py"]):
-        return "python"
-    elif any(pattern in url_lower for pattern in ["cpp", "c++", "cxx"]):
-        return "cpp"
-    elif any(pattern in url_lower for pattern in ["rust", "rs-", "-rs"]):
-        return "rust"
-    elif any(pattern in url_lower for pattern in ["go-", "-go", "golang"]):
-        return "go"
-    elif any(pattern in url_lower for pattern in ["wasm", "webassembly"]):
-        return "wasm"
-
-    # Check repository name
-    repo_name = url.split("/")[-1].replace(".git", "").lower()
-    if any(pattern in repo_name for pattern in ["python", "py-", "-py"]):
-        return "python"
-    elif any(pattern in repo_name for pattern in ["cpp", "c++", "cxx"]):
-        return "cpp"
-    elif any(pattern in repo_name for pattern in ["rust", "rs-", "-rs"]):
-        return "rust"
-    elif any(pattern in repo_name for pattern in ["go-", "-go", "golang"]):
-        return "go"
-    elif any(pattern in repo_name for pattern in ["wasm", "webassembly"]):
-        return "wasm"
 
+def _match_language(text: str) -> Optional[str]:
+    """First language in _LANG_HINTS with a hint in lowercased ``text``."""
+    for language, hints in _LANG_HINTS:
+        for hint in hints:
+            if hint in text:
+                return language
     return None
 
 
+def detect_language_from_url(url: str) -> Optional[str]:
+    """Attempt to detect language from repository URL or name."""
+    # Check for language-specific patterns in URL
+    language = _match_language(url.lower())
+    if language:
+        return language
+
+    # Check repository name. It is part of the URL, so it can only add a hit
+    # where dropping an inner ".git" joins text up; otherwise skip the scan.
+    last = url.rpartition("/")[2]
+    if ".git" not in last[:-1]:
+        return None
+    return _match_language(last.replace(".git", "").lower())
+
+
+def load_config(config_path: str) -> Any:
+    """Load a YAML config file.
+
+    The parsed content is cached by file contents, so unchanged files skip the
+    YAML parser on later runs; any edit produces a new cache entry.
+    """
+    with open(config_path, "rb") as f:
+        data = f.read()
+
+    import yaml
+
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+    # A different PyYAML release or loader may parse the same text differently
+    key = hashlib.blake2b(data, digest_size=16)
+    key.update(f"{_CONFIG_CACHE_VERSION}:{yaml.__version__}:{Loader.__name__}".encode())
+    cache_path = CONFIG_CACHE_DIR / f"{key.hexdigest()}.json"
+    try:
+        return _json_loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        # Missing or unreadable cache entry; parse the YAML instead
+        pass
+
+    content: Any = yaml.load(data, Loader=Loader)
+    try:
+        encoded = _json_dumps(content)
+        # Only cache plain JSON data; dates, binary or non-string keys
+        # wouldn't come back out the same
+        if _json_loads(encoded) != content:
+            return content
+    except (TypeError, ValueError):
+        return content
+    try:
+        CONFIG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(encoded)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # The cache is an optimization only
+        pass
+    return content
+
+
 def get_language_choice() -> str:
     """Get language choice from user."""
-    languages = ["python", "cpp", "rust", "go", "wasm"]
-
     print_info("Available languages:")
-    for i, lang in enumerate(languages, 1):
-        print(f"  {i}. {lang}")
+    _print_menu(_LANGUAGES)
 
     while True:
         try:
-            choice = input("Select language (1-5): ").strip()
+            choice = _read_line("Select language (1-5): ").strip()
             if choice.isdigit() and 1 <= int(choice) <= 5:
-                return languages[int(choice) - 1]
-            elif choice in languages:
+                return _LANGUAGES[int(choice) - 1]
+            elif choice in _LANGUAGES:
                 return choice
             else:
                 print_error("Please enter a number 1-5 or the language name.")
@@ -132,43 +289,40 @@ def get_language_choice() -> str:
             print_error("Invalid choice. Please try again.")
 
 
-def get_adapters_for_language(language: str) -> List[str]:
+def get_adapters_for_language(language: str) -> Tuple[str, ...]:
     """Get suggested adapters for a language."""
-    adapter_map = {
-        "python": ["ruff", "mypy"],
-        "cpp": ["clang-tidy", "vcpkg"],
-        "rust": ["cargo-check", "cargo-fmt"],
-        "go": ["go-fmt", "go-vet"],
-        "wasm": ["wasm-pack", "wasm-bindgen"],
-    }
-    return adapter_map.get(language, [])
+    return _ADAPTER_MAP.get(language, ())
 
 
-def get_bindings_for_language(language: str) -> List[str]:
+def get_bindings_for_language(language: str) -> Tuple[str, ...]:
     """Get suggested bindings for a language."""
-    binding_map = {
-        "python": ["grpc"],
-        "cpp": ["pybind11", "grpc"],
-        "rust": ["pyo3", "wasm", "grpc"],
-        "go": ["cgo", "grpc"],
-        "wasm": ["wasm"],
-    }
-    return binding_map.get(language, [])
+    return _BINDING_MAP.get(language, ())
+
+
+def _dump_yaml(content: Dict[str, Any], stream: Optional[IO[str]] = None):
+    """Dump a config mapping to ``stream``, or return it as a string."""
+    import yaml
+
+    Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+    return yaml.dump(
+        content, stream, Dumper=Dumper, default_flow_style=False, sort_keys=False
+    )
 
 
 def create_repos_yaml(repos: List[Dict[str, Any]]) -> str:
     """Create repos.yaml content."""
-    content = {"repositories": repos}
-    return yaml.dump(content, default_flow_style=False, sort_keys=False)
+    return _dump_yaml({"repositories": repos})
 
 
-def create_cache_config(
-    use_local: bool = True,
-    use_redis: bool = False,
-    use_s3: bool = False,
-    use_gcs: bool = False,
-) -> str:
-    """Create cache_config.yaml content."""
+def dump_repos_yaml(repos: List[Dict[str, Any]], stream: IO[str]) -> None:
+    """Write repos.yaml content straight to ``stream``."""
+    _dump_yaml({"repositories": repos}, stream)
+
+
+def _cache_config(
+    use_local: bool, use_redis: bool, use_s3: bool, use_gcs: bool
+) -> Dict[str, Any]:
     backends = []
 
     if use_local:
@@ -218,7 +372,7 @@ def create_cache_config(
             }
         )
 
-    content = {
+    return {
         "backends": backends,
         "policies": {
             "build_artifacts": {"enabled": True, "ttl": 604800, "max_size_mb": 1024},
@@ -226,17 +380,24 @@ def create_cache_config(
         },
     }
 
-    return yaml.dump(content, default_flow_style=False, sort_keys=False)
 
+# (language, endpoint) defaults written for each enabled registry
+_DEFAULT_ENDPOINTS = (
+    ("python", "pypi"),
+    ("rust", "crates_io"),
+    ("wasm", "npm"),
+    ("cpp", "vcpkg"),
+    ("go", "go_modules"),
+)
 
-def create_distribution_config(
-    use_pypi: bool = False,
-    use_npm: bool = False,
-    use_vcpkg: bool = False,
-    use_crates: bool = False,
-    use_go_modules: bool = False,
-) -> str:
-    """Create distribution_config.yaml content."""
+
+def _distribution_config(
+    use_pypi: bool,
+    use_npm: bool,
+    use_vcpkg: bool,
+    use_crates: bool,
+    use_go_modules: bool,
+) -> Dict[str, Any]:
     endpoints = {}
 
     if use_pypi:
@@ -295,15 +456,16 @@ def create_distribution_config(
             "options": {"auto_tag": True, "tag_prefix": "v", "push_tags": True},
         }
 
-    content = {
+    return {
         "endpoints": endpoints,
         "global": {
             "default_endpoints": {
-                "python": ["pypi"] if use_pypi else [],
-                "rust": ["crates_io"] if use_crates else [],
-                "wasm": ["npm"] if use_npm else [],
-                "cpp": ["vcpkg"] if use_vcpkg else [],
-                "go": ["go_modules"] if use_go_modules else [],
+                language: [endpoint]
+                for (language, endpoint), enabled in zip(
+                    _DEFAULT_ENDPOINTS,
+                    (use_pypi, use_crates, use_npm, use_vcpkg, use_go_modules),
+                )
+                if enabled
             },
             "require_validation": True,
             "continue_on_failure": False,
@@ -311,11 +473,115 @@ def create_distribution_config(
         },
     }
 
-    return yaml.dump(content, default_flow_style=False, sort_keys=False)
+
+# The generated configs depend only on a handful of flags, so each combination
+# (including the common all-defaults one) is emitted at most once per process
+@lru_cache(maxsize=None)
+def _cache_config_yaml(
+    use_local: bool, use_redis: bool, use_s3: bool, use_gcs: bool
+) -> str:
+    return _dump_yaml(_cache_config(use_local, use_redis, use_s3, use_gcs))
+
+
+@lru_cache(maxsize=None)
+def _distribution_config_yaml(
+    use_pypi: bool,
+    use_npm: bool,
+    use_vcpkg: bool,
+    use_crates: bool,
+    use_go_modules: bool,
+) -> str:
+    return _dump_yaml(
+        _distribution_config(use_pypi, use_npm, use_vcpkg, use_crates, use_go_modules)
+    )
+
+
+def create_cache_config(
+    use_local: bool = True,
+    use_redis: bool = False,
+    use_s3: bool = False,
+    use_gcs: bool = False,
+) -> str:
+    """Create cache_config.yaml content."""
+    return _cache_config_yaml(use_local, use_redis, use_s3, use_gcs)
+
+
+def dump_cache_config(
+    stream: IO[str],
+    use_local: bool = True,
+    use_redis: bool = False,
+    use_s3: bool = False,
+    use_gcs: bool = False,
+) -> None:
+    """Write cache_config.yaml content straight to ``stream``."""
+    stream.write(_cache_config_yaml(use_local, use_redis, use_s3, use_gcs))
+
+
+def create_distribution_config(
+    use_pypi: bool = False,
+    use_npm: bool = False,
+    use_vcpkg: bool = False,
+    use_crates: bool = False,
+    use_go_modules: bool = False,
+) -> str:
+    """Create distribution_config.yaml content."""
+    return _distribution_config_yaml(
+        use_pypi, use_npm, use_vcpkg, use_crates, use_go_modules
+    )
+
+
+def dump_distribution_config(
+    stream: IO[str],
+    use_pypi: bool = False,
+    use_npm: bool = False,
+    use_vcpkg: bool = False,
+    use_crates: bool = False,
+    use_go_modules: bool = False,
+) -> None:
+    """Write distribution_config.yaml content straight to ``stream``."""
+    stream.write(
+        _distribution_config_yaml(
+            use_pypi, use_npm, use_vcpkg, use_crates, use_go_modules
+        )
+    )
 
 
-def run_wizard() -> bool:
-    """Run the interactive setup wizard."""
+def run_wizard(config_path: Optional[str] = None, scripted: bool = False) -> bool:
+    """Run the interactive setup wizard.
+
+    When ``config_path`` names a YAML or JSON answers file, the prompts are
+    skipped and the configuration files are generated from it directly.
+
+    With ``scripted``, the answers to every prompt are read from stdin in one
+    go (e.g. a heredoc), one per line; stdin must reach EOF.
+    """
+    if config_path is not None:
+        return _run_batch(config_path)
+
+    global _stdin_lines
+
+    # Output is flushed before each prompt anyway (input() does it), so there
+    # is no need to flush after every printed line in between
+    relined: Optional[io.TextIOWrapper] = None
+    if isinstance(sys.stdout, io.TextIOWrapper) and sys.stdout.line_buffering:
+        relined = sys.stdout
+        relined.reconfigure(line_buffering=False)
+    # Scripted answers are read in one go rather than one input() call per
+    # prompt. Only on request: an open pipe that never reaches EOF would
+    # otherwise block here forever
+    if scripted:
+        _stdin_lines = iter(sys.stdin.readlines())
+    try:
+        return _run_wizard()
+    finally:
+        _stdin_lines = None
+        if relined is not None:
+            relined.reconfigure(line_buffering=True)
+        sys.stdout.flush()
+
+
+def _run_wizard() -> bool:
+    """Prompt for the project setup and write the configuration files."""
     print_header("Welcome to Universal Recycle!")
     print_info("This wizard will help you set up your Universal Recycle project.")
     print_info(
@@ -368,35 +634,19 @@ def run_wizard() -> bool:
             adapters = suggested_adapters
         else:
             print_info("Available adapters:")
-            all_adapters = [
-                "ruff",
-                "mypy",
-                "clang-tidy",
-                "vcpkg",
-                "cargo-check",
-                "cargo-fmt",
-                "go-fmt",
-                "go-vet",
-                "wasm-pack",
-                "wasm-bindgen",
-            ]
-            for i, adapter in enumerate(all_adapters, 1):
-                print(f"  {i}. {adapter}")
+            all_adapters = _ALL_ADAPTERS
+            _print_menu(all_adapters)
 
             adapter_choice = get_user_input(
                 "Enter adapter numbers (comma-separated) or 'all' for suggested"
             )
             if adapter_choice.lower() == "all":
                 adapters = suggested_adapters
+            elif _CSV_INT.match(adapter_choice):
+                adapters = _pick_options(adapter_choice, all_adapters)
             else:
-                try:
-                    indices = [int(x.strip()) - 1 for x in adapter_choice.split(",")]
-                    adapters = [
-                        all_adapters[i] for i in indices if 0 <= i < len(all_adapters)
-                    ]
-                except (ValueError, IndexError):
-                    print_warning("Invalid choice, using suggested adapters")
-                    adapters = suggested_adapters
+                print_warning("Invalid choice, using suggested adapters")
+                adapters = suggested_adapters
 
         # Get bindings
         suggested_bindings = get_bindings_for_language(language)
@@ -409,32 +659,27 @@ def run_wizard() -> bool:
             bindings = suggested_bindings
         else:
             print_info("Available bindings:")
-            all_bindings = ["pybind11", "pyo3", "cgo", "wasm", "grpc"]
-            for i, binding in enumerate(all_bindings, 1):
-                print(f"  {i}. {binding}")
+            all_bindings = _ALL_BINDINGS
+            _print_menu(all_bindings)
 
             binding_choice = get_user_input(
                 "Enter binding numbers (comma-separated) or 'all' for suggested"
             )
             if binding_choice.lower() == "all":
                 bindings = suggested_bindings
+            elif _CSV_INT.match(binding_choice):
+                bindings = _pick_options(binding_choice, all_bindings)
             else:
-                try:
-                    indices = [int(x.strip()) - 1 for x in binding_choice.split(",")]
-                    bindings = [
-                        all_bindings[i] for i in indices if 0 <= i < len(all_bindings)
-                    ]
-                except (ValueError, IndexError):
-                    print_warning("Invalid choice, using suggested bindings")
-                    bindings = suggested_bindings
+                print_warning("Invalid choice, using suggested bindings")
+                bindings = suggested_bindings
 
         repo_config = {
             "name": repo_name,
             "language": language,
             "git": repo_url,
             "commit": "main",
-            "adapters": adapters,
-            "bindings": bindings,
+            "adapters": list(adapters),
+            "bindings": list(bindings),
             "description": f"Recycled {language} library",
         }
 
@@ -466,30 +711,56 @@ def run_wizard() -> bool:
     use_crates = get_yes_no("Publish Rust packages to crates.io?", "N")
     use_go_modules = get_yes_no("Publish Go modules?", "N")
 
-    # Generate configuration files
-    print_header("Generating Configuration Files")
+    _write_configs(
+        project_name,
+        repos,
+        (use_local_cache, use_redis_cache, use_s3_cache, use_gcs_cache),
+        (use_pypi, use_npm, use_vcpkg, use_crates, use_go_modules),
+    )
 
-    # Create repos.yaml
-    repos_content = create_repos_yaml(repos)
-    with open("repos.yaml", "w") as f:
-        f.write(repos_content)
-    print_success("Created repos.yaml")
+    # Offer to run initial commands
+    run_initial = get_yes_no("Would you like to run the initial sync now?", "Y")
+    if run_initial:
+        print_info("Running initial sync...")
+        # This would be handled by the main CLI
+        return True
 
-    # Create cache_config.yaml
-    cache_content = create_cache_config(
-        use_local_cache, use_redis_cache, use_s3_cache, use_gcs_cache
-    )
-    with open("cache_config.yaml", "w") as f:
-        f.write(cache_content)
-    print_success("Created cache_config.yaml")
+    return True
 
-    # Create distribution_config.yaml
-    dist_content = create_distribution_config(
-        use_pypi, use_npm, use_vcpkg, use_crates, use_go_modules
-    )
-    with open("distribution_config.yaml", "w") as f:
-        f.write(dist_content)
-    print_success("Created distribution_config.yaml")
+
+def _write_file(path: str, write: Callable[[IO[str]], None]) -> None:
+    """Open ``path`` for writing and let ``write`` fill it."""
+    with open(path, "w") as f:
+        write(f)
+
+
+def _write_configs(
+    project_name: str,
+    repos: List[Dict[str, Any]],
+    cache_flags: Tuple[bool, ...],
+    distribution_flags: Tuple[bool, ...],
+) -> None:
+    """Write the three configuration files and print the summary."""
+    # Generate configuration files
+    print_header("Generating Configuration Files")
+
+    # The files are independent, so write them concurrently and report them
+    # in the usual order once each one is done
+    writers = {
+        "repos.yaml": lambda f: dump_repos_yaml(repos, f),
+        "cache_config.yaml": lambda f: dump_cache_config(f, *cache_flags),
+        "distribution_config.yaml": lambda f: dump_distribution_config(
+            f, *distribution_flags
+        ),
+    }
+    with ThreadPoolExecutor(max_workers=len(writers)) as executor:
+        futures = [
+            (path, executor.submit(_write_file, path, write))
+            for path, write in writers.items()
+        ]
+        for path, future in futures:
+            future.result()
+            print_success(f"Created {path}")
 
     # Summary and next steps
     print_header("Setup Complete!")
@@ -506,7 +777,7 @@ def run_wizard() -> bool:
     print("  3. Run: python recycle/cli.py adapt")
     print("  4. Run: python recycle/cli.py bind")
 
-    if any([use_pypi, use_npm, use_vcpkg, use_crates, use_go_modules]):
+    if any(distribution_flags):
         print("  5. Configure your distribution credentials")
         print(
             "  6. Run: python recycle/cli.py distribute --distribution-command distribute"
@@ -514,11 +785,80 @@ def run_wizard() -> bool:
 
     print_info("For help, run: python recycle/cli.py --help")
 
-    # Offer to run initial commands
-    run_initial = get_yes_no("Would you like to run the initial sync now?", "Y")
-    if run_initial:
-        print_info("Running initial sync...")
-        # This would be handled by the main CLI
-        return True
 
+def _repo_from_answers(entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Build a repos.yaml entry from an answers-file entry, filling defaults."""
+    name = entry.get("name")
+    url = entry.get("git") or entry.get("url")
+    if not name or not url:
+        print_error("Each repository needs a 'name' and a 'git' URL")
+        return None
+
+    language = entry.get("language") or detect_language_from_url(url)
+    if not language:
+        print_error(f"Could not detect language for {name}; set 'language'")
+        return None
+
+    return {
+        "name": name,
+        "language": language,
+        "git": url,
+        "commit": entry.get("commit", "main"),
+        "adapters": list(entry.get("adapters", get_adapters_for_language(language))),
+        "bindings": list(entry.get("bindings", get_bindings_for_language(language))),
+        "description": entry.get("description", f"Recycled {language} library"),
+    }
+
+
+def _run_batch(config_path: str) -> bool:
+    """Generate the configuration files from an answers file without prompting."""
+    import yaml
+
+    try:
+        answers = load_config(config_path) or {}
+    except (OSError, yaml.YAMLError) as e:
+        print_error(f"Could not read {config_path}: {e}")
+        return False
+    if not isinstance(answers, dict):
+        print_error(f"{config_path} must contain a mapping")
+        return False
+
+    entries = answers.get("repositories") or answers.get("repos") or []
+    if not isinstance(entries, list):
+        print_error(f"'repositories' in {config_path} must be a list")
+        return False
+
+    repos = []
+    for index, entry in enumerate(entries, 1):
+        if not isinstance(entry, dict):
+            print_error(
+                f"Repository entry {index} in {config_path} must be a mapping "
+                f"with 'name' and 'git' keys, got {entry!r}"
+            )
+            return False
+        repo = _repo_from_answers(entry)
+        if repo is None:
+            return False
+        repos.append(repo)
+
+    if not repos:
+        print_error("No repositories added. Setup cancelled.")
+        return False
+
+    cache = answers.get("cache") or {}
+    distribution = answers.get("distribution") or {}
+    _write_configs(
+        answers.get("project_name", "my-recycle-project"),
+        repos,
+        (
+            bool(cache.get("local", True)),
+            bool(cache.get("redis", False)),
+            bool(cache.get("s3", False)),
+            bool(cache.get("gcs", False)),
+        ),
+        tuple(
+            bool(distribution.get(key, False))
+            for key in ("pypi", "npm", "vcpkg", "crates", "go_modules")
+        ),
+    )
     return True
@@ -1,17 +1,52 @@
 # Auto-generated gRPC client for python_requests
+# Install with protobuf>=4 so messages use the fast upb backend.
+import threading
+
 import grpc
 import python_requests_pb2
 import python_requests_pb2_grpc
 
+# Channels shared by all clients, keyed by (host, port): [channel, refcount]
+_CHANNELS = {}
+_CHANNELS_LOCK = threading.Lock()
+_CHANNEL_OPTIONS = [('grpc.keepalive_time_ms', 30000)]
+
 class python_requestsClient:
     def __init__(self, host='localhost', port=50051):
-        self.channel = grpc.insecure_channel(f'{host}:{port}')
+        self._key = (host, port)
+        with _CHANNELS_LOCK:
+            entry = _CHANNELS.get(self._key)
+            if entry is None:
+                channel = grpc.insecure_channel(f'{host}:{port}', options=_CHANNEL_OPTIONS)
+                entry = _CHANNELS[self._key] = [channel, 0]
+            entry[1] += 1
+        self.channel = entry[0]
         self.stub = python_requests_pb2_grpc.python_requestsServiceStub(self.channel)
+        # Per-thread request message reused across get_info calls
+        self._local = threading.local()
     
     def get_info(self, query: str) -> str:
-        request = python_requests_pb2.GetInfoRequest(query=query)
+        request = getattr(self._local, 'request', None)
+        if request is None:
+            request = self._local.request = python_requests_pb2.GetInfoRequest()
+        request.query = query
         response = self.stub.GetInfo(request)
         return response.info if response.success else "Error"
     
+    def get_info_many(self, queries):
+        # All queries share one streaming RPC instead of a round trip each
+        requests = (python_requests_pb2.GetInfoRequest(query=query) for query in queries)
+        for response in self.stub.GetInfoStream(requests):
+            yield response.info if response.success else "Error"
+    
     def close(self):
-        self.channel.close()
+        # The channel is shared; only the last client using it closes it
+        if self.channel is None:
+            return
+        with _CHANNELS_LOCK:
+            entry = _CHANNELS[self._key]
+            entry[1] -= 1
+            if entry[1] == 0:
+                del _CHANNELS[self._key]
+                self.channel.close()
+        self.channel = None
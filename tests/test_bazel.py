@@ -0,0 +1,48 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "recycle"))
+
+from bazel import write_all_build_files, write_bazel_build_file  # noqa: E402
+
+REPO = {"name": "demo", "language": "python"}
+PROFILE = {"cflags": "-O2", "env": {"DEBUG": "0"}}
+
+
+class WriteBuildFileTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.repo_path = os.path.join(self.tmp.name, "demo")
+        os.mkdir(self.repo_path)
+        self.build_path = os.path.join(self.repo_path, "BUILD")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_unchanged_inputs_skip_the_write(self):
+        self.assertTrue(write_bazel_build_file(REPO, self.repo_path, PROFILE))
+        # Backdate the file so a rewrite would be visible in the mtime
+        os.utime(self.build_path, ns=(1_000_000_000, 1_000_000_000))
+
+        self.assertFalse(write_bazel_build_file(REPO, self.repo_path, PROFILE))
+        self.assertEqual(os.stat(self.build_path).st_mtime_ns, 1_000_000_000)
+
+    def test_changed_profile_rewrites(self):
+        write_bazel_build_file(REPO, self.repo_path, PROFILE)
+        self.assertTrue(
+            write_bazel_build_file(REPO, self.repo_path, {**PROFILE, "cflags": "-g"})
+        )
+
+    def test_write_all_skips_up_to_date_and_missing_repos(self):
+        repos = [REPO, {"name": "not-synced", "language": "go"}]
+        first = write_all_build_files(repos, self.tmp.name, PROFILE)
+        self.assertEqual(first, {"demo": True, "not-synced": False})
+        again = write_all_build_files(repos, self.tmp.name, PROFILE)
+        self.assertEqual(again, {"demo": False, "not-synced": False})
+
+
+if __name__ == "__main__":
+    unittest.main()
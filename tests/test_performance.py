@@ -0,0 +1,39 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "recycle"))
+
+from performance import EnhancedCacheManager  # noqa: E402
+
+
+class CacheKeyTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.manager = EnhancedCacheManager({"local_cache_dir": self.tmp.name})
+
+    def tearDown(self):
+        self.manager.close()
+        self.tmp.cleanup()
+
+    def test_bool_and_int_profiles_get_distinct_keys(self):
+        key = self.manager.get_cache_key
+        self.assertNotEqual(key("t", {"x": True}), key("t", {"x": 1}))
+        self.assertNotEqual(key("t", {"x": 1}), key("t", {"x": 1.0}))
+        self.assertNotEqual(key("t", {"x": 0.0}), key("t", {"x": -0.0}))
+
+    def test_interned_key_matches_fresh_key(self):
+        profile = {"cflags": "-O2", "env": {"DEBUG": "0"}, "opts": [1, True]}
+        first = self.manager.get_cache_key("t", profile)
+        again = self.manager.get_cache_key("t", dict(profile))
+        fresh = EnhancedCacheManager({"local_cache_dir": self.tmp.name})
+        try:
+            self.assertEqual(first, again)
+            self.assertEqual(first, fresh.get_cache_key("t", profile))
+        finally:
+            fresh.close()
+
+
+if __name__ == "__main__":
+    unittest.main()